@@ -12,17 +12,24 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
-try:
-    from google_takeout_live_photos.gui import main as gui_main
-    
-    if __name__ == "__main__":
-        print("🚀 Launching Google Takeout Live Photos Helper GUI...")
+
+def gui_main():
+    """Import the GUI module and run it; tkinter is only loaded at this point."""
+    # A plain (function-local) import keeps the module visible to PyInstaller's analysis
+    from google_takeout_live_photos.gui import main
+
+    main()
+
+
+if __name__ == "__main__":
+    # Print the banner before tkinter and the package load so it appears immediately
+    print("🚀 Launching Google Takeout Live Photos Helper GUI...")
+    try:
         gui_main()
-        
-except ImportError as e:
-    print(f"❌ Error: Could not import GUI module: {e}")
-    print("Make sure all required files are in the same directory.")
-    sys.exit(1)
-except Exception as e:
-    print(f"❌ Error launching GUI: {e}")
-    sys.exit(1)
+    except ImportError as e:
+        print(f"❌ Error: Could not import GUI module: {e}")
+        print("Make sure all required files are in the same directory.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error launching GUI: {e}")
+        sys.exit(1)
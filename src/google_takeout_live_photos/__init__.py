@@ -11,6 +11,12 @@ __author__ = "Charles Wang"
 __email__ = "charleswangmain@gmail.com"
 __description__ = "Transform messy Google Takeout exports into organized Live Photos and sorted media files"
 
-from .processor import GoogleTakeoutProcessor
-
 __all__ = ["GoogleTakeoutProcessor", "__version__", "__version_info__", "DISPLAY_VERSION"]
+
+
+def __getattr__(name):
+    """Import the processor on first access (PEP 562) to keep CLI startup light."""
+    if name == "GoogleTakeoutProcessor":
+        from .processor import GoogleTakeoutProcessor
+        return GoogleTakeoutProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
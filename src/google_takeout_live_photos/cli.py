@@ -11,7 +11,6 @@ import os
 import sys
 from pathlib import Path
 
-from .processor import GoogleTakeoutProcessor
 from ._version import __version__, DISPLAY_VERSION
 
 
@@ -95,6 +94,9 @@ Examples:
         print(f"Error: Directory does not exist: {args.root}", file=sys.stderr)
         sys.exit(1)
 
+    # Imported here so --help, --version and --gui don't load the processor
+    from .processor import GoogleTakeoutProcessor
+
     # Create processor and run
     try:
         processor = GoogleTakeoutProcessor(
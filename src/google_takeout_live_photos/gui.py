@@ -13,17 +13,22 @@ Features:
 - Integrated donation support for project sustainability
 """
 
+import logging
 import os
+import queue
 import sys
 import threading
+import time
 import tkinter as tk
 import webbrowser
+from itertools import islice
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-from typing import Optional
+from tkinter import font as tkfont
+from typing import Dict, List, Optional, Tuple
 
 from .processor import GoogleTakeoutProcessor
-from ._version import __version__, DISPLAY_VERSION
+from ._version import __version__
 
 # UI Theme Colors
 LIGHT_THEME = {
@@ -50,6 +55,86 @@ DARK_THEME = {
     'donate': '#4A90E2',          # Muted blue for donation elements
 }
 
+# Log/status updates are queued by the worker thread and applied on the Tk thread
+UI_POLL_INTERVAL_MS = 50
+UI_BATCH_SIZE = 500
+
+# Oldest log lines are trimmed beyond this so long runs don't bloat the Text widget
+MAX_LOG_LINES = 5000
+
+# Named ttk styles for the raised section panels; setup_theme colors them, so a theme
+# toggle restyles every panel without touching the widgets one by one
+SECTION_FRAME_STYLE = "Section.TFrame"
+ACCENT_FRAME_STYLE = "Accent.TFrame"
+SECTION_LABEL_STYLE = "Section.TLabel"
+SECTION_HINT_LABEL_STYLE = "SectionHint.TLabel"
+SECTION_WARNING_LABEL_STYLE = "SectionWarning.TLabel"
+ACCENT_LABEL_STYLE = "Accent.TLabel"
+SECTION_CHECK_STYLE = "Section.TCheckbutton"
+
+# A theme toggle is applied this long after the last click on the toggle button
+THEME_TOGGLE_DELAY_MS = 150
+
+# Paragraph labels are re-wrapped this long after the last window resize
+REWRAP_DELAY_MS = 100
+
+# Default folder for the browse dialogs, resolved once
+_HOME = os.path.expanduser("~")
+
+# Lines inserted per idle callback when filling the issues dialog
+ISSUES_CHUNK_LINES = 500
+
+# While the total is still unknown (scanning), the progress bar steps once per interval
+PROGRESS_PULSE_INTERVAL_S = 1.0
+
+# Seconds a directory-existence check is reused by validate_inputs()
+ISDIR_CACHE_TTL = 2.0
+
+# Fixed sections of the issues report
+_STORAGE_WARNING_LINES = (
+    "\n⚠️ STORAGE WARNING:",
+    "   Copy mode is enabled - this will double your storage usage!",
+    "   Consider using symbolic links instead if storage is limited.",
+)
+_DEDUPE_EXPLANATION_LINES = (
+    "\n✅ DEDUPLICATION ENABLED:",
+    "   Files with identical content (by hash) are skipped from leftovers",
+    "   This prevents the same file appearing in both pairs and leftovers folders",
+)
+_RECOMMENDATION_LINES = (
+    "\n💡 RECOMMENDATIONS:",
+    "   1. Check for duplicate exports in your Google Takeout",
+    "   2. Consider manually reviewing conflicted files",
+    "   3. Orphaned videos might need manual pairing or could be standalone clips",
+    "   4. Use verbose mode for more detailed logging",
+    "   5. Enable deduplication to prevent files in both output folders",
+    "=" * 60,
+)
+
+
+class _TkQueueHandler(logging.Handler):
+    """Logging handler that forwards processor records to the GUI log."""
+
+    _LEVEL_TAGS = {
+        logging.WARNING: "WARNING",
+        logging.ERROR: "ERROR",
+        logging.CRITICAL: "ERROR",
+    }
+
+    def __init__(self, log_message, cancel_event: threading.Event):
+        super().__init__()
+        self._log_message = log_message
+        self._cancel_event = cancel_event
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Once the run is cancelled only warnings and errors are worth formatting and queueing
+        if record.levelno < logging.WARNING and self._cancel_event.is_set():
+            return
+        try:
+            self._log_message(self.format(record), self._LEVEL_TAGS.get(record.levelno, "INFO"))
+        except Exception:
+            self.handleError(record)
+
 
 class GoogleTakeoutGUI:
     """Main GUI application class."""
@@ -59,12 +144,13 @@ class GoogleTakeoutGUI:
         self.root = root
         self.root.title("Google Takeout Live Photos Helper")
         # Size dynamically to fit screen so content isn't cut off
-        self.root.update_idletasks()
         screen_w = self.root.winfo_screenwidth()
         screen_h = self.root.winfo_screenheight()
         desired_w = min(1100, max(900, screen_w - 120))
         desired_h = min(1000, max(700, screen_h - 140))
-        self.root.geometry(f"{desired_w}x{desired_h}")
+        self._window_size = (desired_w, desired_h)
+        # Size and position in one geometry call, before any child widgets exist
+        self.center_window()
         self.root.minsize(min(desired_w, max(800, screen_w - 200)),
                           min(desired_h, max(650, screen_h - 220)))
         self.root.resizable(True, True)
@@ -72,8 +158,12 @@ class GoogleTakeoutGUI:
         # Theme management
         self.is_dark_mode = False
         self.current_theme = LIGHT_THEME
+        self._theme_job: Optional[str] = None
         
-        # Apply theme
+        # Apply theme; the Style object and the options last applied to each style are kept
+        # so toggles only send the settings that actually change
+        self._style: Optional[ttk.Style] = None
+        self._applied_styles: Dict[Tuple[str, str], Dict] = {}
         self.setup_theme()
         
         # Set window background
@@ -90,63 +180,145 @@ class GoogleTakeoutGUI:
         self.show_issues = tk.BooleanVar(value=False)
         self.prepare_apple = tk.BooleanVar(value=False)
 
-        # Processing state
+        # Processing state; each run gets a daemon worker thread, so closing the window
+        # never leaves a job running without one
         self.processing = False
+        self._cancel = threading.Event()
         self.processor: Optional[GoogleTakeoutProcessor] = None
 
+        # (root, output) paths resolved by the last successful validate_inputs(); editing
+        # either folder field clears it
+        self._validated_paths: Optional[Tuple[Path, Path]] = None
+        self.root_dir.trace_add("write", self._invalidate_validation)
+        self.output_dir.trace_add("write", self._invalidate_validation)
+
+        # LivePhotos/OtherMedia folders of the current (or last) run
+        self._pairs_dir: Optional[Path] = None
+        self._leftovers_dir: Optional[Path] = None
+        # Options of the last started run; the summary and issues report read these, not the Tk vars
+        self._run_config: Dict = {}
+
+        # Folder the browse dialogs reopen in (last selection)
+        self._last_browse_dir: Optional[str] = None
+
+        # path -> (checked_at, is_dir) for _fast_isdir()
+        self._isdir_cache: Dict[str, Tuple[float, bool]] = {}
+
+        # Pending (kind, level, payload) updates from the worker thread, where
+        # kind is "log", "status", "progress", "notice" (info dialog, level is its title)
+        # or "done"
+        self._ui_queue = queue.Queue()
+        self._last_progress_pct = -1
+        self._last_pulse = 0.0
+        self._log_lines = 0
+
+        # Labels whose wraplength follows the window width, and the pending re-wrap
+        self._paragraphs = []
+        self._rewrap_job: Optional[str] = None
+
         self.setup_ui()
-        self.center_window()
+        self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+
+    def _apply_style(self, name: str, **options) -> None:
+        """Configure a ttk style unless it already has exactly these options."""
+        key = ("configure", name)
+        if self._applied_styles.get(key) != options:
+            self._style.configure(name, **options)
+            self._applied_styles[key] = options
+
+    def _apply_style_map(self, name: str, **options) -> None:
+        """Set a ttk style's state map unless it already has exactly these options."""
+        key = ("map", name)
+        if self._applied_styles.get(key) != options:
+            self._style.map(name, **options)
+            self._applied_styles[key] = options
 
     def setup_theme(self) -> None:
         """Configure the theme based on current mode."""
-        style = ttk.Style()
-        
-        # Use a base theme that supports customization
-        style.theme_use("clam")
+        if self._style is None:
+            self._style = ttk.Style()
+            # Use a base theme that supports customization; switching themes reloads its
+            # whole option database, so only do it once (not on every light/dark toggle)
+            if self._style.theme_use() != "clam":
+                self._style.theme_use("clam")
+        
+        theme = self.current_theme
+
+        # Status label color per level, looked up on each status update
+        self._status_colors = {
+            "INFO": theme['text_primary'],
+            "SUCCESS": theme['success'],
+            "WARNING": theme['warning'],
+            "ERROR": theme['error'],
+        }
         
         # Configure ttk widget styles with current theme
-        style.configure('TFrame', background=self.current_theme['bg_primary'])
-        style.configure('TLabel', background=self.current_theme['bg_primary'], 
-                       foreground=self.current_theme['text_primary'])
+        self._apply_style('TFrame', background=theme['bg_primary'])
+        self._apply_style('TLabel', background=theme['bg_primary'], 
+                          foreground=theme['text_primary'])
         
         # Entry widgets
-        style.configure('TEntry',
-                        fieldbackground=self.current_theme['bg_secondary'],
-                        bordercolor=self.current_theme['bg_accent'],
-                        lightcolor=self.current_theme['bg_accent'],
-                        foreground=self.current_theme['text_primary'])
+        self._apply_style('TEntry',
+                          fieldbackground=theme['bg_secondary'],
+                          bordercolor=theme['bg_accent'],
+                          lightcolor=theme['bg_accent'],
+                          foreground=theme['text_primary'])
         
         # Buttons with attractive styling
-        style.configure('TButton', background=self.current_theme['bg_accent'],
-                       foreground=self.current_theme['text_primary'], font=('Arial', 9))
-        style.map('TButton', background=[('active', self.current_theme['bg_secondary'])])
+        self._apply_style('TButton', background=theme['bg_accent'],
+                          foreground=theme['text_primary'], font=('Arial', 9))
+        self._apply_style_map('TButton', background=[('active', theme['bg_secondary'])])
         
         # Accent button for important actions
-        style.configure('Accent.TButton', background=self.current_theme['donate'],
-                       foreground='white', font=('Arial', 10, 'bold'))
-        style.map('Accent.TButton', background=[('active', '#2563EB')])
+        self._apply_style('Accent.TButton', background=theme['donate'],
+                          foreground='white', font=('Arial', 10, 'bold'))
+        self._apply_style_map('Accent.TButton', background=[('active', '#2563EB')])
         
         # Progress bar
-        style.configure('TProgressbar', background=self.current_theme['donate'],
-                       troughcolor=self.current_theme['bg_secondary'])
+        self._apply_style('TProgressbar', background=theme['donate'],
+                          troughcolor=theme['bg_secondary'])
+        
+        # Raised section panels and their contents
+        self._apply_style(SECTION_FRAME_STYLE, background=theme['bg_secondary'])
+        self._apply_style(ACCENT_FRAME_STYLE, background=theme['bg_accent'])
+        self._apply_style(SECTION_LABEL_STYLE, background=theme['bg_secondary'],
+                          foreground=theme['text_primary'])
+        self._apply_style(SECTION_HINT_LABEL_STYLE, background=theme['bg_secondary'],
+                          foreground=theme['text_secondary'])
+        self._apply_style(SECTION_WARNING_LABEL_STYLE, background=theme['bg_secondary'],
+                          foreground=theme['warning'])
+        self._apply_style(ACCENT_LABEL_STYLE, background=theme['bg_accent'],
+                          foreground=theme['text_secondary'])
+        self._apply_style(SECTION_CHECK_STYLE, background=theme['bg_secondary'],
+                          foreground=theme['text_primary'], indicatorbackground=theme['bg_accent'],
+                          font=('Arial', 10))
+        self._apply_style_map(SECTION_CHECK_STYLE, background=[('active', theme['bg_secondary'])])
         
         # Spinbox
-        style.configure('TSpinbox',
-                        fieldbackground=self.current_theme['bg_secondary'],
-                        bordercolor=self.current_theme['bg_accent'],
-                        foreground=self.current_theme['text_primary'])
+        self._apply_style('TSpinbox',
+                          fieldbackground=theme['bg_secondary'],
+                          bordercolor=theme['bg_accent'],
+                          foreground=theme['text_primary'])
 
     def toggle_dark_mode(self) -> None:
         """Toggle between light and dark mode."""
         self.is_dark_mode = not self.is_dark_mode
-        self.current_theme = DARK_THEME if self.is_dark_mode else LIGHT_THEME
+
+        # Apply once the clicks stop, so rapid toggling only restyles for the final mode
+        if self._theme_job is not None:
+            self.root.after_cancel(self._theme_job)
+        self._theme_job = self.root.after(THEME_TOGGLE_DELAY_MS, self._apply_theme_mode)
+
+    def _apply_theme_mode(self) -> None:
+        """Restyle the window for the selected mode, if it isn't already showing."""
+        self._theme_job = None
+        target = DARK_THEME if self.is_dark_mode else LIGHT_THEME
+        if target is self.current_theme:
+            return
+        self.current_theme = target
         
-        # Reapply theme
+        # Reapply theme (refresh_theme also recolors the root window)
         self.setup_theme()
-        self.root.configure(bg=self.current_theme['bg_primary'])
-        
-        # Update all widgets - this is a simplified approach
-        # In a full implementation, you'd recursively update all widgets
         self.refresh_theme()
 
     def setup_ui(self) -> None:
@@ -188,6 +360,10 @@ class GoogleTakeoutGUI:
                 self.canvas.itemconfigure(self._canvas_window, width=event.width)
             except Exception:
                 pass
+            # Re-wrap paragraphs once the resize settles rather than on every pixel of a drag
+            if self._rewrap_job is not None:
+                self.root.after_cancel(self._rewrap_job)
+            self._rewrap_job = self.root.after(REWRAP_DELAY_MS, self._rewrap_paragraphs, event.width)
         self.canvas.bind("<Configure>", _on_canvas_configure)
 
         # Mouse wheel support
@@ -230,17 +406,19 @@ class GoogleTakeoutGUI:
         title_label.grid(row=current_row, column=0, columnspan=2, pady=(0, 8), sticky=tk.W)
         current_row += 1
 
-        # Descriptive subtitle
+        # Descriptive subtitle; wraps to the window width (see _rewrap_paragraphs)
         description = (
-            "Transform your messy Google Takeout exports into organized Live Photos\n"
+            "Transform your messy Google Takeout exports into organized Live Photos "
             "and neatly sorted media files with just a few clicks."
         )
         desc_label = ttk.Label(
             main_frame, 
             text=description, 
             justify=tk.CENTER,
-            font=("Arial", 11)
+            font=("Arial", 11),
+            wraplength=self._wrap_width(self._window_size[0])
         )
+        self._paragraphs.append(desc_label)
         desc_label.grid(row=current_row, column=0, columnspan=3, pady=(0, 6))
         current_row += 1
         # Tip and privacy moved to hover tooltips in top-right
@@ -265,10 +443,22 @@ class GoogleTakeoutGUI:
         # Results/log section (reduced height by default)
         self.setup_results_section(main_frame, current_row)
 
+    @staticmethod
+    def _wrap_width(available: int) -> int:
+        """Wrap length for paragraph labels in a window content area this wide."""
+        return max(400, available - 80)
+
+    def _rewrap_paragraphs(self, width: int) -> None:
+        """Reflow the paragraph labels to the current content width."""
+        self._rewrap_job = None
+        wraplength = self._wrap_width(width)
+        for label in self._paragraphs:
+            label.configure(wraplength=wraplength)
+
     def setup_theme_toggle(self, parent: ttk.Frame, start_row: int) -> None:
         """Set up the dark mode toggle."""
         # Place in top-right corner with absolute positioning
-        toggle_frame = tk.Frame(parent, bg=self.current_theme['bg_primary'])
+        toggle_frame = ttk.Frame(parent)
         toggle_frame.grid(row=start_row, column=2, sticky=(tk.N, tk.E), pady=(0, 0), padx=(0, 0))
         
         self.theme_button = ttk.Button(
@@ -280,7 +470,7 @@ class GoogleTakeoutGUI:
         self.theme_button.pack(side=tk.TOP, anchor=tk.E)
 
         # Compact info with hover tooltips to save vertical space
-        info_frame = tk.Frame(toggle_frame, bg=self.current_theme['bg_primary'])
+        info_frame = ttk.Frame(toggle_frame)
         info_frame.pack(side=tk.TOP, anchor=tk.E, pady=(6, 0))
 
         tip_label = ttk.Label(info_frame, text="ℹ️ Tip", cursor="question_arrow")
@@ -300,82 +490,27 @@ class GoogleTakeoutGUI:
 
     def refresh_theme(self) -> None:
         """Refresh all widget colors after theme change."""
+        theme = self.current_theme
+
         # Update main window background
-        self.root.configure(bg=self.current_theme['bg_primary'])
-        
-        # Store widget references for updating
-        self.all_frames = []
-        self.all_labels = []
-        self.all_checkbuttons = []
-        
-        def collect_widgets(widget):
-            if isinstance(widget, tk.Frame):
-                self.all_frames.append(widget)
-            elif isinstance(widget, tk.Label):
-                self.all_labels.append(widget)
-            elif isinstance(widget, tk.Checkbutton):
-                self.all_checkbuttons.append(widget)
-            
-            for child in widget.winfo_children():
-                collect_widgets(child)
-        
-        collect_widgets(self.root)
-        
-        # Update all frames
-        for frame in self.all_frames:
-            try:
-                current_bg = frame.cget('bg')
-                if current_bg in ['#E6F3FF', '#404040']:  # Secondary backgrounds
-                    frame.configure(bg=self.current_theme['bg_secondary'])
-                elif current_bg in ['#CCE7FF', '#505050']:  # Accent backgrounds  
-                    frame.configure(bg=self.current_theme['bg_accent'])
-                elif current_bg in ['#FFFFFF', '#2D2D2D']:  # Primary backgrounds
-                    frame.configure(bg=self.current_theme['bg_primary'])
-            except tk.TclError:
-                pass
-        
-        # Update all labels
-        for label in self.all_labels:
-            try:
-                label.configure(
-                    bg=self.current_theme['bg_secondary'],
-                    fg=self.current_theme['text_primary']
-                )
-            except tk.TclError:
-                pass
+        self.root.configure(bg=theme['bg_primary'])
         
-        # Update all checkbuttons
-        for check in self.all_checkbuttons:
-            try:
-                check.configure(
-                    bg=self.current_theme['bg_secondary'],
-                    fg=self.current_theme['text_primary'],
-                    selectcolor=self.current_theme['bg_accent']
-                )
-            except tk.TclError:
-                pass
+        # Sections, labels and checkbuttons follow the named ttk styles set in setup_theme;
+        # only the plain Tk widgets need recoloring here
+        self.canvas.configure(background=theme['bg_primary'])
         
-        # Update log text area
-        try:
-            self.log_text.configure(
-                bg=self.current_theme['bg_primary'],
-                fg=self.current_theme['text_primary']
-            )
-        except (AttributeError, tk.TclError):
-            pass
+        # Update log text area (if it has been created yet)
+        if self.log_text is not None:
+            self.log_text.configure(bg=theme['bg_primary'], fg=theme['text_primary'])
+            self._configure_log_tags()
+
+        # Drop the status label's per-level color so it picks up the new style's text color
+        self.status_label.configure(foreground="")
         
         # Update theme button text
         self.theme_button.configure(
             text="☀️ Light Mode" if self.is_dark_mode else "🌙 Dark Mode"
         )
-        # Force ttk entry/spinbox redraw to pick up new foreground colors
-        try:
-            if hasattr(self, 'takeout_entry'):
-                self.takeout_entry.configure()
-            if hasattr(self, 'output_entry'):
-                self.output_entry.configure()
-        except Exception:
-            pass
 
     def attach_tooltip(self, widget: tk.Widget, text: str) -> None:
         """Attach a simple tooltip to a widget."""
@@ -389,13 +524,14 @@ class GoogleTakeoutGUI:
             y = widget.winfo_rooty() + widget.winfo_height() + 6
             tooltip = tk.Toplevel(widget)
             tooltip.wm_overrideredirect(True)
-            tooltip.configure(bg=self.current_theme['bg_secondary'])
+            theme = self.current_theme
+            tooltip.configure(bg=theme['bg_secondary'])
             label = tk.Label(
                 tooltip,
                 text=text,
                 justify=tk.LEFT,
-                bg=self.current_theme['bg_secondary'],
-                fg=self.current_theme['text_primary'],
+                bg=theme['bg_secondary'],
+                fg=theme['text_primary'],
                 relief=tk.SOLID,
                 borderwidth=1,
                 font=("Arial", 9),
@@ -421,28 +557,28 @@ class GoogleTakeoutGUI:
     def setup_donation_section(self, parent: ttk.Frame, start_row: int) -> None:
         """Set up the prominent donation section."""
         # Create donation frame with light blue background
-        donate_frame = tk.Frame(parent, bg=self.current_theme['bg_secondary'], relief=tk.RAISED, bd=2)
+        donate_frame = ttk.Frame(parent, style=SECTION_FRAME_STYLE, relief=tk.RAISED, borderwidth=2)
         donate_frame.grid(row=start_row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10), padx=5)
         
         # Add title label
-        title_label = tk.Label(
+        title_label = ttk.Label(
             donate_frame,
+            style=SECTION_LABEL_STYLE,
             text="💖 Support Development",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 12, "bold")
         )
         title_label.pack(pady=(6, 4))
         
         # Donation message
-        donate_text = tk.Label(
-            donate_frame, 
+        donate_text = ttk.Label(
+            donate_frame,
+            style=SECTION_LABEL_STYLE,
             text="If this tool helps organize your photos, please consider supporting its development!",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 10),
-            wraplength=400
+            justify=tk.CENTER,
+            wraplength=self._wrap_width(self._window_size[0])
         )
+        self._paragraphs.append(donate_text)
         donate_text.pack(pady=(0, 6))
         
         # Donation button with accent styling
@@ -457,15 +593,14 @@ class GoogleTakeoutGUI:
     def setup_directory_section(self, parent: ttk.Frame, start_row: int) -> None:
         """Set up the enhanced directory selection section."""
         # Create directory frame with light blue background
-        dir_frame = tk.Frame(parent, bg=self.current_theme['bg_secondary'], relief=tk.RAISED, bd=2)
+        dir_frame = ttk.Frame(parent, style=SECTION_FRAME_STYLE, relief=tk.RAISED, borderwidth=2)
         dir_frame.grid(row=start_row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10), padx=5)
         
         # Add title label
-        title_label = tk.Label(
+        title_label = ttk.Label(
             dir_frame,
+            style=SECTION_LABEL_STYLE,
             text="📁 Directory Selection",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 12, "bold")
         )
         title_label.grid(row=0, column=0, columnspan=3, pady=(6, 10))
@@ -474,11 +609,10 @@ class GoogleTakeoutGUI:
         dir_frame.columnconfigure(1, weight=1)
 
         # Google Takeout directory with light blue styling
-        tk.Label(
-            dir_frame, 
+        ttk.Label(
+            dir_frame,
+            style=SECTION_LABEL_STYLE,
             text="Google Takeout Directory:",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 10, "bold")
         ).grid(row=1, column=0, sticky=tk.W, pady=(0, 8), padx=(15, 0))
         
@@ -493,11 +627,10 @@ class GoogleTakeoutGUI:
         ).grid(row=2, column=2, padx=(0, 15), pady=(0, 8))
 
         # Output directory with light blue styling
-        tk.Label(
-            dir_frame, 
+        ttk.Label(
+            dir_frame,
+            style=SECTION_LABEL_STYLE,
             text="Output Directory:",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 10, "bold")
         ).grid(row=3, column=0, sticky=tk.W, pady=(8, 8), padx=(15, 0))
         
@@ -512,32 +645,29 @@ class GoogleTakeoutGUI:
         ).grid(row=4, column=2, padx=(0, 15), pady=(0, 8))
 
         # Enhanced info about automatic subdirectories
-        info_frame = tk.Frame(dir_frame, bg=self.current_theme['bg_accent'], relief=tk.RAISED, bd=1)
+        info_frame = ttk.Frame(dir_frame, style=ACCENT_FRAME_STYLE, relief=tk.RAISED, borderwidth=1)
         info_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(8, 8), padx=10)
         
-        info_label = tk.Label(
+        info_label = ttk.Label(
             info_frame,
+            style=ACCENT_LABEL_STYLE,
             text="💡 The tool will automatically create 'LivePhotos' and 'OtherMedia' subdirectories",
-            bg=self.current_theme['bg_accent'],
-            fg=self.current_theme['text_secondary'],
             font=("Arial", 9),
-            padx=10,
-            pady=5
+            padding=(10, 5)
         )
         info_label.pack()
 
     def setup_options_section(self, parent: ttk.Frame, start_row: int) -> int:
         """Set up the enhanced options section."""
         # Options frame with light blue background
-        options_frame = tk.Frame(parent, bg=self.current_theme['bg_secondary'], relief=tk.RAISED, bd=2)
+        options_frame = ttk.Frame(parent, style=SECTION_FRAME_STYLE, relief=tk.RAISED, borderwidth=2)
         options_frame.grid(row=start_row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10), padx=5)
         
         # Add title label
-        title_label = tk.Label(
+        title_label = ttk.Label(
             options_frame,
+            style=SECTION_LABEL_STYLE,
             text="⚙️ Processing Options",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 12, "bold")
         )
         title_label.grid(row=0, column=0, columnspan=2, pady=(6, 10), padx=15)
@@ -546,113 +676,92 @@ class GoogleTakeoutGUI:
         options_frame.columnconfigure(1, weight=1)
 
         # Copy files option with warning
-        copy_frame = tk.Frame(options_frame, bg=self.current_theme['bg_secondary'])
+        copy_frame = ttk.Frame(options_frame, style=SECTION_FRAME_STYLE)
         copy_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=4, padx=15)
         
         # Create custom checkbutton with light blue background
-        copy_check = tk.Checkbutton(
+        copy_check = ttk.Checkbutton(
             copy_frame,
+            style=SECTION_CHECK_STYLE,
             text="Copy files instead of creating symbolic links",
-            variable=self.copy_files,
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
-            selectcolor=self.current_theme['bg_accent'],
-            font=("Arial", 10)
+            variable=self.copy_files
         )
         copy_check.pack(side=tk.LEFT)
         
         # Warning label for copy mode with theme colors
-        copy_warning = tk.Label(
+        copy_warning = ttk.Label(
             copy_frame,
+            style=SECTION_WARNING_LABEL_STYLE,
             text="⚠️ Will double storage usage",
-            fg=self.current_theme['warning'],
-            bg=self.current_theme['bg_secondary'],
             font=("Arial", 9, "bold")
         )
         copy_warning.pack(side=tk.LEFT, padx=(10, 0))
 
         # Dry run option
-        dry_run_check = tk.Checkbutton(
+        dry_run_check = ttk.Checkbutton(
             options_frame,
+            style=SECTION_CHECK_STYLE,
             text="Dry run (preview changes without making them)",
-            variable=self.dry_run,
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
-            selectcolor=self.current_theme['bg_accent'],
-            font=("Arial", 10)
+            variable=self.dry_run
         )
         dry_run_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=4, padx=15)
 
         # Verbose option
-        verbose_check = tk.Checkbutton(
-            options_frame, 
+        verbose_check = ttk.Checkbutton(
+            options_frame,
+            style=SECTION_CHECK_STYLE,
             text="Verbose logging", 
-            variable=self.verbose,
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
-            selectcolor=self.current_theme['bg_accent'],
-            font=("Arial", 10)
+            variable=self.verbose
         )
         verbose_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=4, padx=15)
 
         # Deduplication option with explanation
-        dedupe_frame = tk.Frame(options_frame, bg=self.current_theme['bg_secondary'])
+        dedupe_frame = ttk.Frame(options_frame, style=SECTION_FRAME_STYLE)
         dedupe_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=4, padx=15)
         
-        dedupe_check = tk.Checkbutton(
+        dedupe_check = ttk.Checkbutton(
             dedupe_frame,
+            style=SECTION_CHECK_STYLE,
             text="Remove duplicate files from leftovers (by content hash)",
-            variable=self.dedupe_leftovers,
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
-            selectcolor=self.current_theme['bg_accent'],
-            font=("Arial", 10)
+            variable=self.dedupe_leftovers
         )
         dedupe_check.pack(side=tk.LEFT)
         
         # Info tooltip with theme colors
-        dedupe_info = tk.Label(
+        dedupe_info = ttk.Label(
             dedupe_frame,
+            style=SECTION_HINT_LABEL_STYLE,
             text="ℹ️ Prevents same file in both folders",
-            fg=self.current_theme['text_secondary'],
-            bg=self.current_theme['bg_secondary'],
             font=("Arial", 9)
         )
         dedupe_info.pack(side=tk.LEFT, padx=(10, 0))
 
         # Show issues option
-        issues_check = tk.Checkbutton(
+        issues_check = ttk.Checkbutton(
             options_frame,
+            style=SECTION_CHECK_STYLE,
             text="Show detailed issue report after processing",
-            variable=self.show_issues,
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
-            selectcolor=self.current_theme['bg_accent'],
-            font=("Arial", 10)
+            variable=self.show_issues
         )
         issues_check.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=4, padx=15)
 
         # Prepare for Apple Photos import
-        prepare_check = tk.Checkbutton(
+        prepare_check = ttk.Checkbutton(
             options_frame,
+            style=SECTION_CHECK_STYLE,
             text="Prepare for Apple Photos import (adds identifiers)",
-            variable=self.prepare_apple,
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
-            selectcolor=self.current_theme['bg_accent'],
-            font=("Arial", 10)
+            variable=self.prepare_apple
         )
         prepare_check.grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=4, padx=15)
 
         # Max duration setting
-        duration_frame = tk.Frame(options_frame, bg=self.current_theme['bg_secondary'])
+        duration_frame = ttk.Frame(options_frame, style=SECTION_FRAME_STYLE)
         duration_frame.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=4, padx=15)
 
-        tk.Label(
-            duration_frame, 
+        ttk.Label(
+            duration_frame,
+            style=SECTION_LABEL_STYLE,
             text="Max video duration for Live Photos (seconds):",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 10)
         ).pack(side=tk.LEFT)
         
@@ -667,17 +776,15 @@ class GoogleTakeoutGUI:
         duration_spinbox.pack(side=tk.LEFT, padx=(10, 0))
 
         # Enhanced tip section
-        tip_frame = tk.Frame(options_frame, bg=self.current_theme['bg_accent'], relief=tk.RAISED, bd=1)
+        tip_frame = ttk.Frame(options_frame, style=ACCENT_FRAME_STYLE, relief=tk.RAISED, borderwidth=1)
         tip_frame.grid(row=8, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 8), padx=15)
         
-        tk.Label(
+        ttk.Label(
             tip_frame,
+            style=ACCENT_LABEL_STYLE,
             text="💡 Tip: Always use dry run first to preview what will happen!",
-            bg=self.current_theme['bg_accent'],
-            fg=self.current_theme['text_secondary'],
             font=("Arial", 10, "bold"),
-            padx=10,
-            pady=8
+            padding=(10, 8)
         ).pack()
 
         return start_row + 1
@@ -719,29 +826,27 @@ class GoogleTakeoutGUI:
     def setup_progress_section(self, parent: ttk.Frame, start_row: int) -> int:
         """Set up the enhanced progress section."""
         # Progress frame with light blue background
-        progress_frame = tk.Frame(parent, bg=self.current_theme['bg_secondary'], relief=tk.RAISED, bd=2)
+        progress_frame = ttk.Frame(parent, style=SECTION_FRAME_STYLE, relief=tk.RAISED, borderwidth=2)
         progress_frame.grid(row=start_row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 15), padx=5)
         
         # Add title label
-        title_label = tk.Label(
+        title_label = ttk.Label(
             progress_frame,
+            style=SECTION_LABEL_STYLE,
             text="📊 Processing Status",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 12, "bold")
         )
         title_label.pack(pady=(10, 10))
         
         # Progress bar with enhanced styling
-        self.progress = ttk.Progressbar(progress_frame, mode="indeterminate", length=400)
+        self.progress = ttk.Progressbar(progress_frame, mode="determinate", maximum=100, length=400)
         self.progress.pack(pady=(0, 8), fill=tk.X, padx=15)
 
         # Status label with theme colors
-        self.status_label = tk.Label(
-            progress_frame, 
+        self.status_label = ttk.Label(
+            progress_frame,
+            style=SECTION_LABEL_STYLE,
             text="Ready to process photos",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 10)
         )
         self.status_label.pack(pady=(0, 10))
@@ -751,136 +856,272 @@ class GoogleTakeoutGUI:
     def setup_results_section(self, parent: ttk.Frame, start_row: int) -> None:
         """Set up the enhanced results/log section."""
         # Results frame with light blue background
-        results_frame = tk.Frame(parent, bg=self.current_theme['bg_secondary'], relief=tk.RAISED, bd=2)
+        results_frame = ttk.Frame(parent, style=SECTION_FRAME_STYLE, relief=tk.RAISED, borderwidth=2)
         results_frame.grid(row=start_row, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10), padx=5)
         results_frame.columnconfigure(0, weight=1)
         results_frame.rowconfigure(1, weight=1)
         
         # Add title label
-        title_label = tk.Label(
+        title_label = ttk.Label(
             results_frame,
+            style=SECTION_LABEL_STYLE,
             text="📋 Processing Log",
-            bg=self.current_theme['bg_secondary'],
-            fg=self.current_theme['text_primary'],
             font=("Arial", 12, "bold")
         )
         title_label.grid(row=0, column=0, pady=(10, 10), padx=15)
 
-        # Enhanced log text area with theme colors
-        self.log_text = scrolledtext.ScrolledText(
-            results_frame, 
-            height=8, 
-            wrap=tk.WORD, 
-            font=("Consolas", 10),
-            bg=self.current_theme['bg_primary'],
-            fg=self.current_theme['text_primary'],
-            insertbackground=self.current_theme['text_primary'],
-            selectbackground=self.current_theme['bg_accent']
+        # The log text area is created on the first message (see _ensure_log_text);
+        # until then a plain label holds its place
+        self._results_frame = results_frame
+        self.log_text: Optional[scrolledtext.ScrolledText] = None
+        self._log_placeholder: Optional[ttk.Label] = ttk.Label(
+            results_frame,
+            style=SECTION_LABEL_STYLE,
+            text="Log messages will appear here once processing starts.",
+            font=("Arial", 10)
         )
-        self.log_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=15, pady=(0, 15))
+        self._log_placeholder.grid(row=1, column=0, padx=15, pady=(0, 15))
 
         # Configure grid weight for resizing
         parent.rowconfigure(start_row, weight=1)
 
+    def _ensure_log_text(self) -> scrolledtext.ScrolledText:
+        """Create the log text area on first use and return it."""
+        if self.log_text is None:
+            if self._log_placeholder is not None:
+                self._log_placeholder.destroy()
+                self._log_placeholder = None
+
+            # Named fonts are resolved by Tk once and shared by the widget and its level tags
+            self._log_font = tkfont.Font(family="Consolas", size=10)
+            self._log_font_bold = tkfont.Font(family="Consolas", size=10, weight="bold")
+
+            # Enhanced log text area with theme colors
+            theme = self.current_theme
+            self.log_text = scrolledtext.ScrolledText(
+                self._results_frame,
+                height=8,
+                wrap=tk.WORD,
+                font=self._log_font,
+                bg=theme['bg_primary'],
+                fg=theme['text_primary'],
+                insertbackground=theme['text_primary'],
+                selectbackground=theme['bg_accent'],
+                # Read-only log: no undo stack or edit separators to maintain per insert
+                undo=False,
+                autoseparators=False,
+                maxundo=0,
+                state=tk.DISABLED
+            )
+            self.log_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=15, pady=(0, 15))
+            self._configure_log_tags()
+        return self.log_text
+
+    def _configure_log_tags(self) -> None:
+        """Configure the per-level text tags; needed only at creation and on theme change."""
+        theme = self.current_theme
+        bold = self._log_font_bold
+        self.log_text.tag_configure("INFO", foreground=theme['text_primary'])
+        self.log_text.tag_configure("SUCCESS", foreground=theme['success'], font=bold)
+        self.log_text.tag_configure("WARNING", foreground=theme['warning'], font=bold)
+        self.log_text.tag_configure("ERROR", foreground=theme['error'], font=bold)
+
     def center_window(self) -> None:
         """Center the window on the screen."""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        # Use the size chosen in __init__ rather than forcing a layout pass to measure it
+        width, height = self._window_size
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
 
     def browse_takeout_directory(self) -> None:
         """Open directory browser for Google Takeout directory."""
-        # Start in user's home directory for better UX
-        initial_dir = os.path.expanduser("~")
+        # Reopen where the last selection was made, falling back to the home directory
+        initial_dir = self._last_browse_dir or _HOME
         
         directory = filedialog.askdirectory(
             title="Select Google Takeout Directory",
-            initialdir=initial_dir
+            initialdir=initial_dir,
+            mustexist=True
         )
         if directory:
+            self._last_browse_dir = directory
             self.root_dir.set(directory)
             
             # Auto-suggest output directory next to the Takeout folder
             if not self.output_dir.get():
-                suggested_output = str(Path(directory).parent / f"{Path(directory).name}_Processed")
-                self.output_dir.set(suggested_output)
+                takeout_path = Path(directory)
+                self.output_dir.set(str(takeout_path.parent / f"{takeout_path.name}_Processed"))
 
     def browse_output_directory(self) -> None:
         """Open directory browser for output directory."""
         # Start in same directory as Takeout folder if available
-        initial_dir = os.path.expanduser("~")
-        if self.root_dir.get():
-            initial_dir = str(Path(self.root_dir.get()).parent)
+        initial_dir = self._last_browse_dir or _HOME
+        root_text = self.root_dir.get()
+        if root_text:
+            initial_dir = os.path.dirname(os.path.normpath(root_text))
             
+        # mustexist stays off here: the output folder may be typed in and created later
         directory = filedialog.askdirectory(
             title="Select Output Directory (subdirectories will be created automatically)",
             initialdir=initial_dir
         )
         if directory:
+            self._last_browse_dir = directory
             self.output_dir.set(directory)
 
     def log_message(self, message: str, level: str = "INFO") -> None:
-        """Add a color-coded message to the log."""
-        # Configure text tags for different log levels
-        self.log_text.tag_configure("INFO", foreground=self.current_theme['text_primary'])
-        self.log_text.tag_configure("SUCCESS", foreground=self.current_theme['success'], font=("Consolas", 10, "bold"))
-        self.log_text.tag_configure("WARNING", foreground=self.current_theme['warning'], font=("Consolas", 10, "bold"))
-        self.log_text.tag_configure("ERROR", foreground=self.current_theme['error'], font=("Consolas", 10, "bold"))
-        
-        # Insert message with appropriate styling
-        timestamp = ""  # Could add timestamp if desired
-        formatted_message = f"[{level}] {message}\n"
-        
-        start_index = self.log_text.index(tk.END + "-1c")
-        self.log_text.insert(tk.END, formatted_message)
-        end_index = self.log_text.index(tk.END + "-1c")
-        
-        # Apply color tag based on level
-        self.log_text.tag_add(level, start_index, end_index)
-        
-        # Auto-scroll to bottom
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue a color-coded message for the log (safe to call from any thread)."""
+        self._ui_queue.put(("log", level, f"[{level}] {message}\n"))
+
+    def _drain_ui_queue(self) -> None:
+        """Apply queued log and status updates in one batch on the Tk thread."""
+        segments = []
+        status = None
+        progress = None
+        done = None
+        notices = []
+        new_lines = 0
+        drained = 0
+        # Progress chatter still queued when the user pressed Stop is discarded unread
+        cancelled = self._cancel.is_set()
+        try:
+            while drained < UI_BATCH_SIZE:
+                kind, level, payload = self._ui_queue.get_nowait()
+                drained += 1
+                if kind == "log":
+                    if cancelled and level == "INFO":
+                        continue
+                    segments.extend((payload, level))
+                    new_lines += payload.count("\n")
+                elif kind == "status":
+                    status = (payload, level)
+                elif kind == "progress":
+                    progress = payload
+                elif kind == "notice":
+                    notices.append((level, payload))
+                else:
+                    done = payload
+        except queue.Empty:
+            pass
+
+        if segments:
+            log_text = self._ensure_log_text()
+
+            # One insert for the whole batch, each message tagged with its level; the widget
+            # is only writable while the drain updates it
+            log_text.configure(state=tk.NORMAL)
+            log_text.insert(tk.END, *segments)
+
+            # Trim the oldest lines in one delete once the cap is exceeded
+            self._log_lines += new_lines
+            if self._log_lines > MAX_LOG_LINES:
+                excess = self._log_lines - MAX_LOG_LINES
+                log_text.delete("1.0", f"{excess + 1}.0")
+                self._log_lines = MAX_LOG_LINES
+
+            log_text.configure(state=tk.DISABLED)
+            log_text.see(tk.END)
+
+        if status is not None:
+            message, level = status
+            self.status_label.config(
+                text=message,
+                foreground=self._status_colors.get(level, self._status_colors["INFO"])
+            )
+
+        if progress is not None:
+            self.progress['value'] = progress
+        elif self.processing and self._last_progress_pct < 0:
+            # No total yet: an occasional step shows activity without a continuous marquee
+            now = time.monotonic()
+            if now - self._last_pulse >= PROGRESS_PULSE_INTERVAL_S:
+                self._last_pulse = now
+                self.progress.step(1)
+
+        # A full batch means a backlog: come back right after this repaint instead of waiting
+        delay = 1 if drained == UI_BATCH_SIZE else UI_POLL_INTERVAL_MS
+        self.root.after(delay, self._drain_ui_queue)
+
+        # Finish outside this callback so the drain keeps running while result dialogs are open
+        if done is not None:
+            self.root.after_idle(self._finish_processing, *done)
+        for title, message in notices:
+            self.root.after_idle(messagebox.showinfo, title, message)
 
     def clear_log(self) -> None:
         """Clear the log text area."""
-        self.log_text.delete(1.0, tk.END)
+        if self.log_text is not None:
+            self.log_text.configure(state=tk.NORMAL)
+            self.log_text.delete(1.0, tk.END)
+            self.log_text.configure(state=tk.DISABLED)
+        self._log_lines = 0
 
     def update_status(self, message: str, level: str = "INFO") -> None:
-        """Update the status label with appropriate styling."""
-        color_map = {
-            "INFO": self.current_theme['text_primary'],
-            "SUCCESS": self.current_theme['success'],
-            "WARNING": self.current_theme['warning'],
-            "ERROR": self.current_theme['error']
-        }
-        
-        self.status_label.config(
-            text=message,
-            fg=color_map.get(level, self.current_theme['text_primary'])
-        )
-        self.root.update_idletasks()
+        """Queue a status label update (safe to call from any thread)."""
+        self._ui_queue.put(("status", level, message))
+
+    def report_progress(self, files_done: int, files_total: int) -> None:
+        """Queue a progress bar update; only whole-percent changes are forwarded."""
+        percent = files_done * 100 // files_total
+        if percent != self._last_progress_pct:
+            self._last_progress_pct = percent
+            self._ui_queue.put(("progress", None, percent))
+
+    def _fast_isdir(self, path: str) -> bool:
+        """Check that a directory exists, reusing recent answers for the same path."""
+        now = time.monotonic()
+        hit = self._isdir_cache.get(path)
+        if hit is not None and now - hit[0] < ISDIR_CACHE_TTL:
+            return hit[1]
+
+        parent, name = os.path.split(path.rstrip("\\/"))
+        if sys.platform.startswith("win") and parent and name:
+            # One directory enumeration of the parent returns the attributes without
+            # opening the folder itself, which is much cheaper on network shares
+            name = os.path.normcase(name)
+            try:
+                with os.scandir(parent) as entries:
+                    result = any(os.path.normcase(e.name) == name and e.is_dir() for e in entries)
+            except OSError:
+                result = os.path.isdir(path)
+        else:
+            result = os.path.isdir(path)
+
+        self._isdir_cache[path] = (now, result)
+        return result
+
+    def _invalidate_validation(self, *_args) -> None:
+        """Forget the last validated paths (trace callback for the folder fields)."""
+        self._validated_paths = None
 
     def validate_inputs(self) -> bool:
         """Validate user inputs before processing."""
-        if not self.root_dir.get():
+        # Unchanged folders only need the (cached) existence check of the Takeout folder
+        if self._validated_paths is not None:
+            if self._fast_isdir(str(self._validated_paths[0])):
+                return True
+            self._validated_paths = None
+
+        # Read each Tk variable once; the resolved paths are reused by process_photos
+        root_text = self.root_dir.get()
+        output_text = self.output_dir.get()
+
+        if not root_text:
             messagebox.showerror("Error", "Please select a Google Takeout directory")
             return False
 
-        if not os.path.isdir(self.root_dir.get()):
+        if not self._fast_isdir(root_text):
             messagebox.showerror("Error", "Google Takeout directory does not exist")
             return False
 
-        if not self.output_dir.get():
+        if not output_text:
             messagebox.showerror("Error", "Please select an output directory")
             return False
 
-        # Check if output directory would conflict with input
-        output_path = Path(self.output_dir.get())
-        input_path = Path(self.root_dir.get())
+        # Compare resolved paths so symlinked or relative spellings can't slip through
+        input_path = Path(root_text).resolve()
+        output_path = Path(output_text).resolve()
         
         if output_path == input_path:
             messagebox.showerror(
@@ -889,16 +1130,13 @@ class GoogleTakeoutGUI:
             return False
 
         # Check if output is inside input (could cause recursion)
-        try:
-            output_path.relative_to(input_path)
+        if input_path in output_path.parents:
             messagebox.showerror(
                 "Error", "Output directory cannot be inside the Google Takeout directory"
             )
             return False
-        except ValueError:
-            # Not a subdirectory, which is good
-            pass
 
+        self._validated_paths = (input_path, output_path)
         return True
 
     def start_processing(self) -> None:
@@ -910,53 +1148,97 @@ class GoogleTakeoutGUI:
             messagebox.showwarning("Warning", "Processing is already in progress")
             return
 
+        # Snapshot the options here: Tk variables must not be read from the worker thread
+        root_path, output_base = self._validated_paths
+        try:
+            max_video_duration = self.max_duration.get()
+        except tk.TclError:
+            messagebox.showerror("Error", "Max video duration must be a number")
+            return
+        # Output subfolders, shared by the worker and the results summary
+        self._pairs_dir = output_base / "LivePhotos"
+        self._leftovers_dir = output_base / "OtherMedia"
+        config = {
+            'root_dir': root_path,
+            'copy_files': self.copy_files.get(),
+            'dry_run': self.dry_run.get(),
+            'verbose': self.verbose.get(),
+            'max_video_duration': max_video_duration,
+            'dedupe_leftovers': self.dedupe_leftovers.get(),
+            'prepare_apple': self.prepare_apple.get(),
+            'show_issues': self.show_issues.get(),
+        }
+        self._run_config = config
+
         # Clear previous log
         self.clear_log()
 
         # Update UI state
         self.processing = True
+        self._cancel.clear()
         self.process_button.config(state="disabled")
         self.stop_button.config(state="normal")
-        self.progress.start()
+        self.progress['value'] = 0
+        self._last_progress_pct = -1
 
         # Start processing in separate thread
-        processing_thread = threading.Thread(target=self.process_photos, daemon=True)
+        processing_thread = threading.Thread(target=self.process_photos, args=(config,), daemon=True)
         processing_thread.start()
 
+    def shutdown(self) -> None:
+        """Ask a running job to stop when the window closes."""
+        # The worker is a daemon thread, so it can't keep the process alive after the main loop
+        self._cancel.set()
+
     def stop_processing(self) -> None:
         """Stop the current processing."""
-        self.processing = False
+        # The processor checks the event between files; the UI resets once the worker reports done
+        self._cancel.set()
         self.update_status("Stopping...")
 
-    def process_photos(self) -> None:
-        """Process photos using the GoogleTakeoutProcessor."""
+    def process_photos(self, config: Dict) -> None:
+        """Process photos using the GoogleTakeoutProcessor (runs on the worker thread)."""
+        log_handler = None
+        completed = False
+        error = None
         try:
             self.update_status("Initializing processor...")
             self.log_message("Starting Google Takeout Live Photos processing...")
 
             # Create automatic subdirectories
-            output_base = Path(self.output_dir.get())
-            pairs_dir = output_base / "LivePhotos"
-            leftovers_dir = output_base / "OtherMedia"
+            root_path = config['root_dir']
+            pairs_dir = self._pairs_dir
+            leftovers_dir = self._leftovers_dir
             
             self.log_message(f"Output directories:")
             self.log_message(f"  Live Photos: {pairs_dir}")
             self.log_message(f"  Other Media: {leftovers_dir}")
 
-            # Create processor
-            self.processor = GoogleTakeoutProcessor(
-                root_dir=self.root_dir.get(),
-                pairs_dir=str(pairs_dir),
-                leftovers_dir=str(leftovers_dir),
-                copy_files=self.copy_files.get(),
-                dry_run=self.dry_run.get(),
-                verbose=self.verbose.get(),
-                max_video_duration=self.max_duration.get(),
-                dedupe_leftovers=self.dedupe_leftovers.get(),
+            options = dict(
+                pairs_dir=pairs_dir,
+                leftovers_dir=leftovers_dir,
+                copy_files=config['copy_files'],
+                dry_run=config['dry_run'],
+                verbose=config['verbose'],
+                max_video_duration=config['max_video_duration'],
+                dedupe_leftovers=config['dedupe_leftovers'],
+                progress_callback=self.report_progress,
+                cancel_event=self._cancel,
             )
 
-            # Redirect logging to GUI
-            self.setup_processor_logging()
+            # Keep the processor for the same Takeout folder so an unchanged tree
+            # isn't rescanned (the usual dry run, then real run flow)
+            if self.processor is not None and self.processor.root_dir == root_path:
+                self.processor.reapply(**options)
+            else:
+                self.processor = GoogleTakeoutProcessor(root_dir=root_path, **options)
+
+            # Redirect logging to GUI; the records stay out of the console while it runs
+            log_handler = _TkQueueHandler(self.log_message, self._cancel)
+            log_handler.setFormatter(logging.Formatter("%(message)s"))
+            self.processor.logger.addHandler(log_handler)
+            self.processor.logger.propagate = False
+            self.processor.logger.setLevel(logging.DEBUG if config['verbose'] else logging.INFO)
 
             self.update_status("Scanning files...")
             self.log_message("Scanning media files...")
@@ -964,124 +1246,121 @@ class GoogleTakeoutGUI:
             # Process the photos
             self.processor.process()
 
-            if not self.processing:  # Check if stopped
+            completed = not self._cancel.is_set()
+            if not completed:
                 self.log_message("Processing stopped by user", "WARNING")
                 self.update_status("Processing stopped")
             else:
                 self.log_message("Processing completed successfully!", "SUCCESS")
-                self.update_status("Processing completed")
+                self.update_status("Processing completed", "SUCCESS")
+                # Fill the bar even when nothing was staged (no total was ever reported)
+                self._ui_queue.put(("progress", None, 100))
 
                 # Optional Apple preparation
-                if self.prepare_apple.get():
+                if config['prepare_apple']:
                     self.log_message("Preparing Live Photos for Apple Photos import (adding identifiers)...")
                     try:
                         self.processor.prepare_for_apple()
                         self.log_message("Apple import preparation complete", "SUCCESS")
                     except Exception as e:
                         self.log_message(f"Apple preparation failed: {str(e)}", "ERROR")
-                self.show_results()
-                
-                # Show detailed issues if requested
-                if self.show_issues.get() and not self.verbose.get():
-                    has_issues = (self.processor.stats['duplicate_names'] > 0 or 
-                                 self.processor.stats['potential_issues'] > 0 or
-                                 len(self.processor.issues.get('orphaned_videos', [])) > 0)
-                    if has_issues:
-                        self.show_issues_dialog()
 
         except Exception as e:
             self.log_message(f"Error during processing: {str(e)}", "ERROR")
             self.update_status(f"Error: {str(e)}")
-            messagebox.showerror("Processing Error", f"An error occurred:\n\n{str(e)}")
+            error = str(e)
 
         finally:
-            # Reset UI state
-            self.processing = False
-            self.process_button.config(state="normal")
-            self.stop_button.config(state="disabled")
-            self.progress.stop()
-
-    def setup_processor_logging(self) -> None:
-        """Set up logging redirection from processor to GUI."""
-        # This is a simplified approach - in a real implementation,
-        # you might want to use a custom logging handler
-        original_logger_info = self.processor.logger.info
-        original_logger_warning = self.processor.logger.warning
-        original_logger_error = self.processor.logger.error
-
-        def gui_info(msg):
-            self.log_message(str(msg), "INFO")
-            if not self.processing:
-                return  # Stop if processing was cancelled
-
-        def gui_warning(msg):
-            self.log_message(str(msg), "WARNING")
-
-        def gui_error(msg):
-            self.log_message(str(msg), "ERROR")
-
-        self.processor.logger.info = gui_info
-        self.processor.logger.warning = gui_warning
-        self.processor.logger.error = gui_error
+            # Detach the GUI handler so repeated runs don't stack handlers
+            if log_handler is not None:
+                self.processor.logger.removeHandler(log_handler)
+                self.processor.logger.propagate = True
+
+            # Dialogs and button state are Tk calls, so the UI thread finishes the run
+            show_issues = config['show_issues'] and not config['verbose']
+            self._ui_queue.put(("done", None, (completed, error, show_issues)))
+
+    def _finish_processing(self, completed: bool, error: Optional[str], show_issues: bool) -> None:
+        """Reset the controls and show the results of a finished run (Tk thread)."""
+        self.processing = False
+        self.process_button.config(state="normal")
+        self.stop_button.config(state="disabled")
+
+        if error is not None:
+            messagebox.showerror("Processing Error", f"An error occurred:\n\n{error}")
+            return
+        if not completed:
+            return
+
+        self.show_results()
+
+        # Show detailed issues if requested
+        if show_issues:
+            stats = self.processor.stats
+            has_issues = (stats['duplicate_names'] > 0 or 
+                          stats['potential_issues'] > 0 or
+                          bool(self.processor.issues['orphaned_videos']))
+            if has_issues:
+                self.show_issues_dialog()
 
     def show_results(self) -> None:
-        """Show processing results."""
+        """Write the processing summary to the log."""
         if not self.processor:
             return
 
         stats = self.processor.stats
-        total_pairs = stats["same_dir_pairs"] + stats["cross_dir_pairs"]
-
-        result_message = f"""
+        same_dir = stats['same_dir_pairs']
+        cross_dir = stats['cross_dir_pairs']
+        total_pairs = same_dir + cross_dir
+        skipped = stats['leftovers_skipped']
+        dup_names = stats.get('duplicate_names', 0)
+        conflicts = stats.get('potential_issues', 0)
+        orphaned_count = len(self.processor.issues.get('orphaned_videos', []))
+        config = self._run_config
+        dry_run = config['dry_run']
+
+        parts = [f"""
 Processing Complete! 📸
 
 📊 Summary:
 • Files scanned: {stats['total_scanned']:,}
 • Live Photos pairs found: {total_pairs:,}
-  - Same directory: {stats['same_dir_pairs']:,}
-  - Cross directory: {stats['cross_dir_pairs']:,}
+  - Same directory: {same_dir:,}
+  - Cross directory: {cross_dir:,}
 • Other media files: {stats['leftovers_staged']:,}
-"""
+"""]
 
-        if self.dedupe_leftovers.get() and stats['leftovers_skipped'] > 0:
-            result_message += f"• Duplicates skipped: {stats['leftovers_skipped']:,}\n"
+        if config['dedupe_leftovers'] and skipped > 0:
+            parts.append(f"• Duplicates skipped: {skipped:,}\n")
 
         # Add warnings if present
-        has_warnings = (stats.get('duplicate_names', 0) > 0 or 
-                       stats.get('potential_issues', 0) > 0 or
-                       len(self.processor.issues.get('orphaned_videos', [])) > 0)
-        
-        if has_warnings:
-            result_message += f"\n⚠️ Warnings:\n"
-            if stats.get('duplicate_names', 0) > 0:
-                result_message += f"• {stats['duplicate_names']} sets of duplicate file names\n"
-            if stats.get('potential_issues', 0) > 0:
-                result_message += f"• {stats['potential_issues']} potential matching conflicts\n"
-            if len(self.processor.issues.get('orphaned_videos', [])) > 0:
-                orphaned_count = len(self.processor.issues['orphaned_videos'])
-                result_message += f"• {orphaned_count} orphaned videos (might be Live Photos missing partners)\n"
-
-        # Calculate output directories
-        output_base = Path(self.output_dir.get())
-        pairs_dir = output_base / "LivePhotos"
-        leftovers_dir = output_base / "OtherMedia"
-
-        result_message += f"""
+        if dup_names > 0 or conflicts > 0 or orphaned_count > 0:
+            parts.append("\n⚠️ Warnings:\n")
+            if dup_names > 0:
+                parts.append(f"• {dup_names} sets of duplicate file names\n")
+            if conflicts > 0:
+                parts.append(f"• {conflicts} potential matching conflicts\n")
+            if orphaned_count > 0:
+                parts.append(f"• {orphaned_count} orphaned videos (might be Live Photos missing partners)\n")
+
+        parts.append(f"""
 📁 Output locations:
-• Live Photos pairs: {pairs_dir}
-• Other media: {leftovers_dir}
-"""
+• Live Photos pairs: {self._pairs_dir}
+• Other media: {self._leftovers_dir}
+""")
 
-        if self.dry_run.get():
-            result_message += "\n⚠️ This was a dry run - no files were actually moved or copied."
+        if dry_run:
+            parts.append("\n⚠️ This was a dry run - no files were actually moved or copied.")
         else:
-            result_message += "\n\n💖 If this tool helped you, consider supporting it!"
+            parts.append("\n\n💖 If this tool helped you, consider supporting it!")
+
+        result_message = "".join(parts)
 
-        # Show results with donation prompt
-        result = messagebox.showinfo("Processing Complete", result_message)
+        # Append the summary to the log rather than blocking on a modal dialog
+        self.log_message(result_message.strip())
         
         # After showing results, offer donation (only for successful processing)
-        if not self.dry_run.get() and total_pairs > 0:
+        if not dry_run and total_pairs > 0:
             donate_response = messagebox.askyesno(
                 "💖 Support Development",
                 f"Great! You successfully organized {total_pairs} Live Photos!\n\n"
@@ -1109,10 +1388,8 @@ Processing Complete! 📸
         )
         issues_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Generate issues report
-        issues_report = self.generate_issues_report()
-        issues_text.insert(tk.END, issues_report)
-        issues_text.config(state=tk.DISABLED)
+        # Fill the report in chunks so the dialog is usable while long reports load
+        self._stream_lines(issues_text, self._issues_report_lines())
         
         # Add close button
         close_button = ttk.Button(dialog, text="Close", command=dialog.destroy)
@@ -1122,95 +1399,117 @@ Processing Complete! 📸
         dialog.transient(self.root)
         dialog.grab_set()
 
+    def _stream_lines(self, text_widget: tk.Text, lines: List[str], start: int = 0) -> None:
+        """Insert lines into a text widget in chunks, then make it read-only."""
+        end = start + ISSUES_CHUNK_LINES
+        try:
+            text_widget.insert(tk.END, "\n".join(lines[start:end]) + ("\n" if end < len(lines) else ""))
+            if end < len(lines):
+                text_widget.after_idle(self._stream_lines, text_widget, lines, end)
+            else:
+                text_widget.config(state=tk.DISABLED)
+        except tk.TclError:
+            # Dialog closed before the report finished loading
+            pass
+
     def generate_issues_report(self) -> str:
         """Generate a detailed issues report for display."""
+        return "\n".join(self._issues_report_lines())
+
+    def _issues_report_lines(self) -> List[str]:
+        """Build the issues report as a list of lines."""
         if not self.processor:
-            return "No processor available"
+            return ["No processor available"]
             
         report = []
         report.append("🔍 DETAILED ISSUES REPORT")
         report.append("=" * 60)
         
         # Storage warning if copy mode is enabled
-        if self.copy_files.get():
-            report.append("\n⚠️ STORAGE WARNING:")
-            report.append("   Copy mode is enabled - this will double your storage usage!")
-            report.append("   Consider using symbolic links instead if storage is limited.")
+        if self._run_config['copy_files']:
+            report.extend(_STORAGE_WARNING_LINES)
         
+        issues = self.processor.issues
+
         # Structure warnings
-        if self.processor.issues['structure_warnings']:
+        structure_warnings = issues['structure_warnings']
+        if structure_warnings:
             report.append("\n📋 STRUCTURE WARNINGS:")
-            for warning in self.processor.issues['structure_warnings']:
+            for warning in structure_warnings:
                 report.append(f"   ⚠️  {warning}")
         
         # Duplicate names
-        if self.processor.issues['duplicate_names']:
-            report.append(f"\n📋 DUPLICATE FILE NAMES ({len(self.processor.issues['duplicate_names'])} issues):")
-            for i, issue in enumerate(self.processor.issues['duplicate_names'][:10], 1):
+        duplicate_names = issues['duplicate_names']
+        n_duplicates = len(duplicate_names)
+        if n_duplicates:
+            report.append(f"\n📋 DUPLICATE FILE NAMES ({n_duplicates} issues):")
+            for i, issue in enumerate(islice(duplicate_names, 10), 1):
                 report.append(f"\n{i}. {issue['type'].upper()}: '{issue['base_name']}' ({issue['count']} files)")
                 for file_path in issue['files']:
                     report.append(f"   📄 {file_path}")
             
-            if len(self.processor.issues['duplicate_names']) > 10:
-                remaining = len(self.processor.issues['duplicate_names']) - 10
+            if n_duplicates > 10:
+                remaining = n_duplicates - 10
                 report.append(f"\n   ... and {remaining} more duplicate name issues")
         
         # Matching conflicts
-        if self.processor.issues['matching_conflicts']:
-            report.append(f"\n⚡ MATCHING CONFLICTS ({len(self.processor.issues['matching_conflicts'])} conflicts):")
-            for i, conflict in enumerate(self.processor.issues['matching_conflicts'][:5], 1):
+        conflicts = issues['matching_conflicts']
+        n_conflicts = len(conflicts)
+        if n_conflicts:
+            report.append(f"\n⚡ MATCHING CONFLICTS ({n_conflicts} conflicts):")
+            for i, conflict in enumerate(islice(conflicts, 5), 1):
                 report.append(f"\n{i}. '{conflict['base_name']}':")
                 report.append(f"   📸 {conflict['still_count']} still image(s)")
                 report.append(f"   🎥 {conflict['video_count']} video(s)")
                 report.append(f"   ❗ Cannot determine correct Live Photo pairing")
             
-            if len(self.processor.issues['matching_conflicts']) > 5:
-                remaining = len(self.processor.issues['matching_conflicts']) - 5
+            if n_conflicts > 5:
+                remaining = n_conflicts - 5
                 report.append(f"\n   ... and {remaining} more conflicts")
         
         # Orphaned videos
-        if self.processor.issues['orphaned_videos']:
-            report.append(f"\n🎥 ORPHANED VIDEOS ({len(self.processor.issues['orphaned_videos'])} videos):")
+        orphaned = issues['orphaned_videos']
+        n_orphaned = len(orphaned)
+        if n_orphaned:
+            report.append(f"\n🎥 ORPHANED VIDEOS ({n_orphaned} videos):")
             report.append("-" * 40)
             
-            for i, orphan in enumerate(self.processor.issues['orphaned_videos'][:10], 1):
+            for i, orphan in enumerate(islice(orphaned, 10), 1):
                 report.append(f"\n{i}. '{orphan['base_name']}' ({orphan['duration']:.1f}s)")
                 report.append(f"   📄 {orphan['video_path']}")
                 report.append(f"   💡 Short video without matching photo - might be orphaned Live Photo")
             
-            if len(self.processor.issues['orphaned_videos']) > 10:
-                remaining = len(self.processor.issues['orphaned_videos']) - 10
+            if n_orphaned > 10:
+                remaining = n_orphaned - 10
                 report.append(f"\n   ... and {remaining} more orphaned videos")
         
         # Deduplication explanation
-        if self.dedupe_leftovers.get():
-            report.append("\n✅ DEDUPLICATION ENABLED:")
-            report.append("   Files with identical content (by hash) are skipped from leftovers")
-            report.append("   This prevents the same file appearing in both pairs and leftovers folders")
+        if self._run_config['dedupe_leftovers']:
+            report.extend(_DEDUPE_EXPLANATION_LINES)
         
         # Recommendations
-        report.append("\n💡 RECOMMENDATIONS:")
-        report.append("   1. Check for duplicate exports in your Google Takeout")
-        report.append("   2. Consider manually reviewing conflicted files")
-        report.append("   3. Orphaned videos might need manual pairing or could be standalone clips")
-        report.append("   4. Use verbose mode for more detailed logging")
-        report.append("   5. Enable deduplication to prevent files in both output folders")
-        report.append("=" * 60)
+        report.extend(_RECOMMENDATION_LINES)
         
-        return "\n".join(report)
+        return report
 
     def show_support_info(self) -> None:
         """Open PayPal donation page directly."""
-        import webbrowser
-        
         donation_url = "https://www.paypal.com/donate/?hosted_button_id=FPEZJUYKMH7M6"
-        try:
-            webbrowser.open(donation_url)
-        except Exception:
-            messagebox.showinfo(
-                "Donation Link", 
-                f"Please visit this link to donate:\n\n{donation_url}"
-            )
+
+        # Launching the browser can block while it spawns a process, so keep it off the Tk thread
+        def open_browser():
+            try:
+                opened = webbrowser.open(donation_url)
+            except Exception:
+                opened = False
+            if not opened:
+                self._ui_queue.put((
+                    "notice",
+                    "Donation Link",
+                    f"Please visit this link to donate:\n\n{donation_url}"
+                ))
+
+        threading.Thread(target=open_browser, daemon=True).start()
 
 
 def main():
@@ -1235,6 +1534,8 @@ def main():
     except KeyboardInterrupt:
         print("\nGUI application interrupted by user")
         sys.exit(0)
+    finally:
+        app.shutdown()
 
 
 if __name__ == "__main__":
@@ -74,7 +74,10 @@ def main():
         root.protocol("WM_DELETE_WINDOW", on_closing)
         
         # Start the GUI event loop
-        root.mainloop()
+        try:
+            root.mainloop()
+        finally:
+            app.shutdown()
         
     except KeyboardInterrupt:
         print("Application interrupted by user")
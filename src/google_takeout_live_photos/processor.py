@@ -10,34 +10,70 @@ This module contains the main GoogleTakeoutProcessor class that handles:
 
 import hashlib
 import logging
+import mmap
 import os
 import shutil
 import subprocess
-from collections import defaultdict
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Callable, ContextManager, Dict, Iterator, List, Optional, Set, TextIO, Tuple, Union
+)
 import sys
 import uuid
 
+try:
+    import blake3  # Optional: SIMD (and optionally multithreaded) hashing for dedupe
+except ImportError:
+    blake3 = None
+
 # Constants
 STILL_EXTENSIONS = {".heic", ".jpg", ".jpeg", ".png"}
 VIDEO_EXTENSIONS = {".mov", ".mp4"}
 ALL_EXTENSIONS = STILL_EXTENSIONS | VIDEO_EXTENSIONS
 HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+HASH_MMAP_MIN_SIZE = 4 << 20  # larger files are hashed through a memory map
+_HAS_FILE_DIGEST = sys.version_info >= (3, 11)
+# Dedupe compares file sizes first, then a hash of this many leading bytes, and hashes
+# whole files only when both match
+DEDUPE_HEAD_BYTES = 64 * 1024
+HASH_WORKERS = os.cpu_count() or 1  # hashing releases the GIL, so threads overlap I/O and CPU
+FFPROBE_WORKERS = min(8, os.cpu_count() or 1)
+# Videos bigger than this many bytes per second of the duration limit are taken to be too
+# long without running ffprobe (Live Photo clips are far below this bitrate)
+MAX_VIDEO_BYTES_PER_SECOND = 4_000_000
 
 # Type aliases
 FilePath = Union[str, Path]
 MatchType = str
 PairInfo = Tuple[MatchType, str, str, str]  # (match_type, base, still, video)
+ProgressCallback = Callable[[int, int], None]  # (files_done, files_total)
 
 
 class GoogleTakeoutProcessor:
     """Main class for processing Google Takeout Live Photos."""
-    
+
+    # Options reapply() may change between runs (everything but root_dir)
+    _REAPPLY_OPTIONS = frozenset({
+        "pairs_dir", "leftovers_dir", "copy_files", "dry_run", "verbose",
+        "max_video_duration", "dedupe_leftovers", "progress_callback", "cancel_event",
+    })
+
     def __init__(self, root_dir: FilePath, pairs_dir: FilePath, leftovers_dir: FilePath,
                  copy_files: bool = False, dry_run: bool = False, verbose: bool = False,
-                 max_video_duration: float = 6.0, dedupe_leftovers: bool = False):
-        """Initialize the processor with configuration."""
+                 max_video_duration: float = 6.0, dedupe_leftovers: bool = False,
+                 progress_callback: Optional[ProgressCallback] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """Initialize the processor with configuration.
+
+        ``progress_callback``, if given, is called as ``(files_done, files_total)``
+        while pairs and leftovers are staged. Setting ``cancel_event`` stops
+        processing at the next file.
+        """
         self.root_dir = Path(root_dir).resolve()
         self.pairs_dir = Path(pairs_dir).resolve()
         self.leftovers_dir = Path(leftovers_dir).resolve()
@@ -46,12 +82,32 @@ class GoogleTakeoutProcessor:
         self.verbose = verbose
         self.max_video_duration = max_video_duration
         self.dedupe_leftovers = dedupe_leftovers
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+        self._progress_done = 0
+        self._progress_total = 0
+
+        # Scan results kept for reuse by a later process() call (see reapply)
+        self._scan_cache: Optional[Dict] = None
+        self._scanned_dir_mtimes: Dict[str, int] = {}
+        # Every media file found by the last scan, in walk order
+        self._scanned_media_paths: List[str] = []
+
+        # ffprobe results keyed by (path, size, mtime_ns); kept across runs of this processor
+        self._duration_cache: Dict[Tuple[str, int, int], Optional[float]] = {}
+
+        # Output directories where symlinks turned out to be unsupported
+        self._copy_only_dirs: Set[Path] = set()
         
         # Setup logging
         log_level = logging.DEBUG if verbose else logging.INFO
         logging.basicConfig(level=log_level, format='%(levelname)s: %(message)s')
         self.logger = logging.getLogger(__name__)
-        
+
+        self._reset_results()
+
+    def _reset_results(self) -> None:
+        """Clear statistics and issues collected by a previous run."""
         # Statistics
         self.stats = {
             'total_scanned': 0,
@@ -72,6 +128,60 @@ class GoogleTakeoutProcessor:
             'orphaned_videos': []  # Videos that might be Live Photos without partners
         }
 
+        # Output directories already created during this run
+        self._made_dirs: Set[Path] = set()
+
+    def reapply(self, **options) -> None:
+        """Change run options for another process() call on the same root directory.
+
+        Accepts the keyword arguments of ``__init__`` other than ``root_dir``. The
+        file index from the previous scan is reused as long as no directory under
+        the root has been modified since.
+        """
+        for name, value in options.items():
+            if name not in self._REAPPLY_OPTIONS:
+                raise TypeError(f"reapply() got an unexpected keyword argument '{name}'")
+            if name in ("pairs_dir", "leftovers_dir"):
+                value = Path(value).resolve()
+            setattr(self, name, value)
+        self._reset_results()
+
+    def _cache_scan(self, structure_valid: bool, by_dir_base: Dict, stills_by_base: Dict,
+                    videos_by_base: Dict) -> None:
+        """Remember the validation and scan results of this run."""
+        self._scan_cache = {
+            'dir_mtimes': self._scanned_dir_mtimes,
+            'media_paths': self._scanned_media_paths,
+            'structure_valid': structure_valid,
+            'indexes': (by_dir_base, stills_by_base, videos_by_base),
+            'progress_total': self._progress_total,
+            'stats': dict(self.stats),
+            'issues': {key: list(value) for key, value in self.issues.items()},
+        }
+
+    def _cached_scan(self) -> Optional[Tuple[bool, Dict, Dict, Dict]]:
+        """Restore the previous scan if no scanned directory has changed since."""
+        cache = self._scan_cache
+        if cache is None:
+            return None
+
+        # Adding, removing or renaming a file updates its directory's mtime
+        try:
+            for directory, mtime_ns in cache['dir_mtimes'].items():
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return None
+        except OSError:
+            return None
+
+        self.stats.update(cache['stats'])
+        for key, value in cache['issues'].items():
+            self.issues[key] = list(value)
+        self._progress_done = 0
+        self._progress_total = cache['progress_total']
+        self._scanned_media_paths = cache['media_paths']
+        self.logger.info(f"Reusing file index from the previous scan of {self.root_dir}")
+        return (cache['structure_valid'], *cache['indexes'])
+
     # ------------------------------
     # Apple Photos preparation
     # ------------------------------
@@ -80,7 +190,7 @@ class GoogleTakeoutProcessor:
 
         Search order:
         1) Bundled with the app under vendor/exiftool/
-        2) PyInstaller temp directory (sys._MEIPASS)/exiftool
+        2) PyInstaller bundle data directory (sys._MEIPASS)/exiftool
         3) System PATH ('exiftool')
         """
         candidates: List[Path] = []
@@ -92,7 +202,7 @@ class GoogleTakeoutProcessor:
         else:
             candidates.append(vendor_dir / "exiftool")
 
-        # PyInstaller onefile extraction directory
+        # PyInstaller data directory (onedir _internal/ or onefile temp dir)
         meipass = getattr(sys, "_MEIPASS", None)
         if meipass:
             meipass_dir = Path(meipass) / "exiftool"
@@ -158,6 +268,9 @@ class GoogleTakeoutProcessor:
             with open(manifest_path, "r") as f:
                 header = f.readline()  # skip header
                 for line in f:
+                    if self.is_cancelled():
+                        self.logger.warning("Apple preparation cancelled")
+                        break
                     parts = line.rstrip("\n").split("\t")
                     if len(parts) < 7:
                         continue
@@ -177,7 +290,7 @@ class GoogleTakeoutProcessor:
                             "-overwrite_original",
                             f"-ContentIdentifier={cid}",
                             str(still_path)
-                        ], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
                         # Write to video
                         subprocess.run([
@@ -185,7 +298,7 @@ class GoogleTakeoutProcessor:
                             "-overwrite_original",
                             f"-ContentIdentifier={cid}",
                             str(video_path)
-                        ], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
                         updated += 1
                     except subprocess.CalledProcessError as e:
                         failed += 1
@@ -197,25 +310,60 @@ class GoogleTakeoutProcessor:
 
         self.logger.info(f"Apple preparation complete: {updated} pairs updated, {failed} failed")
 
+    def _check_symlink_support(self, directory: Path) -> None:
+        """Probe once whether symlinks can be created in an output directory.
+
+        Symlinks need extra privileges on Windows and are unsupported on
+        filesystems such as FAT32/exFAT; in that case files are copied instead
+        of failing (and falling back) once per file.
+        """
+        if self.copy_files or self.dry_run:
+            return
+
+        # Link to a throwaway file in the output directory, never into the Takeout itself,
+        # so a probe that can't be removed doesn't lead later walks back into the input
+        target = directory / f".symlink_probe_{uuid.uuid4().hex}"
+        probe = target.with_name(target.name + ".link")
+        try:
+            target.touch()
+            os.symlink(target, probe)
+        except (OSError, NotImplementedError) as e:
+            self._copy_only_dirs.add(directory)
+            self.logger.warning(f"Symlinks are not supported in {directory} ({e}); copying files instead")
+        finally:
+            for path in (probe, target):
+                try:
+                    if path.is_symlink() or path.exists():
+                        path.unlink()
+                except OSError as e:
+                    self.logger.warning(f"Could not remove symlink probe {path}: {e}")
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create an output directory, once per run rather than once per staged file."""
+        if directory not in self._made_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(directory)
+
     def safe_link_or_copy(self, src: FilePath, dst: FilePath) -> None:
         """Safely create symlink or copy file, with fallback handling."""
         dst = Path(dst)
-        dst.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(dst.parent)
         
         if dst.exists():
-            self.logger.debug(f"Destination already exists: {dst}")
+            self.logger.debug("Destination already exists: %s", dst)
             return
             
+        use_copy = self.copy_files or dst.parent in self._copy_only_dirs
         try:
-            if self.copy_files:
+            if use_copy:
                 shutil.copy2(src, dst)
-                self.logger.debug(f"Copied: {src} -> {dst}")
+                self.logger.debug("Copied: %s -> %s", src, dst)
             else:
                 os.symlink(src, dst)
-                self.logger.debug(f"Linked: {src} -> {dst}")
+                self.logger.debug("Linked: %s -> %s", src, dst)
         except OSError as e:
             # Fallback to copy if symlink fails
-            if not self.copy_files:
+            if not use_copy:
                 self.logger.warning(f"Symlink failed, copying instead: {e}")
                 shutil.copy2(src, dst)
             else:
@@ -237,6 +385,56 @@ class GoogleTakeoutProcessor:
             logging.getLogger(__name__).warning(f"Failed to get duration for {video_path}: {e}")
             return None
 
+    def _video_durations(self, video_paths: List[str]) -> Dict[str, Optional[float]]:
+        """Look up the durations of several videos, running ffprobe concurrently.
+
+        Results are cached per file version, and files too large to be within
+        ``max_video_duration`` are reported as None without probing them.
+        """
+        durations = {}
+        to_probe = []
+        size_limit = self.max_video_duration * MAX_VIDEO_BYTES_PER_SECOND
+        for video_path in video_paths:
+            try:
+                st = os.stat(video_path)
+            except OSError:
+                to_probe.append((video_path, None))
+                continue
+            if st.st_size > size_limit:
+                durations[video_path] = None
+                continue
+            key = (video_path, st.st_size, st.st_mtime_ns)
+            if key in self._duration_cache:
+                durations[video_path] = self._duration_cache[key]
+            else:
+                to_probe.append((video_path, key))
+
+        if not to_probe:
+            return durations
+
+        def probe(path: str) -> Optional[float]:
+            # Queued probes still run at interpreter exit, so they must be no-ops once cancelled
+            if self.is_cancelled():
+                return None
+            return self.get_video_duration(path)
+
+        with ThreadPoolExecutor(max_workers=FFPROBE_WORKERS) as pool:
+            futures = [pool.submit(probe, path) for path, _ in to_probe]
+            try:
+                for (video_path, key), future in zip(to_probe, futures):
+                    if self.is_cancelled():
+                        break
+                    duration = future.result()
+                    if self.is_cancelled():
+                        break  # May be a skipped probe; don't cache it
+                    durations[video_path] = duration
+                    if key is not None:
+                        self._duration_cache[key] = duration
+            finally:
+                for future in futures:
+                    future.cancel()
+        return durations
+
     def validate_takeout_structure(self) -> bool:
         """Validate that the root directory looks like a proper Google Takeout structure."""
         self.logger.info("Validating Google Takeout structure...")
@@ -251,6 +449,8 @@ class GoogleTakeoutProcessor:
         
         found_indicators = []
         for root, dirs, _ in os.walk(self.root_dir):
+            if self.is_cancelled():
+                break
             for dir_name in dirs:
                 for indicator in takeout_indicators:
                     if indicator in dir_name:
@@ -333,21 +533,30 @@ class GoogleTakeoutProcessor:
         self.logger.info("Checking for potential orphaned Live Photo videos...")
         
         orphaned_count = 0
-        for base_name, video_list in videos_by_base.items():
-            for video_path in video_list:
-                if video_path in used_files:
-                    continue  # Already paired
-                
-                # Check if video duration suggests it might be a Live Photo
-                if self.max_video_duration and self.max_video_duration > 0:
-                    duration = self.get_video_duration(video_path)
-                    if duration is not None and duration <= self.max_video_duration:
-                        orphaned_count += 1
-                        self.issues['orphaned_videos'].append({
-                            'base_name': base_name,
-                            'video_path': video_path,
-                            'duration': duration
-                        })
+        if not (self.max_video_duration and self.max_video_duration > 0):
+            return
+
+        unpaired = [
+            (base_name, video_path)
+            for base_name, video_list in videos_by_base.items()
+            for video_path in video_list
+            if video_path not in used_files
+        ]
+        durations = self._video_durations([video_path for _, video_path in unpaired])
+
+        for base_name, video_path in unpaired:
+            if self.is_cancelled():
+                break
+
+            # Check if video duration suggests it might be a Live Photo
+            duration = durations.get(video_path)
+            if duration is not None and duration <= self.max_video_duration:
+                orphaned_count += 1
+                self.issues['orphaned_videos'].append({
+                    'base_name': base_name,
+                    'video_path': video_path,
+                    'duration': duration
+                })
         
         if orphaned_count > 0:
             self.logger.warning(f"Found {orphaned_count} videos that might be orphaned Live Photos")
@@ -355,16 +564,194 @@ class GoogleTakeoutProcessor:
 
     @staticmethod
     def calculate_sha1(file_path: FilePath) -> str:
-        """Calculate SHA1 hash of a file."""
-        hash_obj = hashlib.sha1()
+        """Calculate SHA1 hash of a file.
+
+        Files over HASH_MMAP_MIN_SIZE are hashed through a read-only memory map.
+        Only files that can't be mapped fall back to reading; a mapped file must
+        not be truncated while it is hashed (the OS faults the process).
+        """
         try:
-            with open(file_path, "rb") as f:
+            with open(file_path, "rb", buffering=0) as f:
+                if os.fstat(f.fileno()).st_size > HASH_MMAP_MIN_SIZE:
+                    # Hash large files straight from the page cache, without copying chunks
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if hasattr(mm, "madvise"):
+                                mm.madvise(mmap.MADV_SEQUENTIAL)
+                            return hashlib.sha1(mm).hexdigest()
+                    except (OSError, ValueError):
+                        pass  # Not mappable (e.g. special files or some network shares): read it
+                if _HAS_FILE_DIGEST:
+                    # Python 3.11+: the read/update loop runs in C
+                    return hashlib.file_digest(f, "sha1", _bufsize=HASH_CHUNK_SIZE).hexdigest()
+                hash_obj = hashlib.sha1()
                 for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                     hash_obj.update(chunk)
-            return hash_obj.hexdigest()
+                return hash_obj.hexdigest()
         except IOError as e:
             raise IOError(f"Failed to calculate hash for {file_path}: {e}") from e
 
+    @classmethod
+    def calculate_content_hash(cls, file_path: FilePath, multithreaded: bool = False) -> str:
+        """Hash a file's content for dedupe (BLAKE3 if installed, SHA1 otherwise).
+
+        Digests are only compared with others from the same run, so the
+        algorithm doesn't need to be stable across installs. BLAKE3 hashes on
+        one thread unless ``multithreaded`` is set; callers already hashing on
+        a thread pool must leave it off to avoid oversubscribing the CPU.
+        """
+        if blake3 is None:
+            return cls.calculate_sha1(file_path)
+        try:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO if multithreaded else 1)
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+        except (IOError, ValueError) as e:
+            raise IOError(f"Failed to calculate hash for {file_path}: {e}") from e
+
+    @staticmethod
+    def calculate_head_hash(file_path: FilePath) -> str:
+        """Hash the first DEDUPE_HEAD_BYTES of a file."""
+        try:
+            with open(file_path, "rb") as f:
+                return hashlib.sha1(f.read(DEDUPE_HEAD_BYTES)).hexdigest()
+        except IOError as e:
+            raise IOError(f"Failed to calculate hash for {file_path}: {e}") from e
+
+    def _bucket_keys(self, paths: List[FilePath], size: int) -> List[Optional[Tuple]]:
+        """Return dedupe keys for files that all have the given size.
+
+        Keys start as ``(size,)`` and are extended with a head hash, then a full
+        content hash, only while they still collide with another file of the
+        bucket. None marks unreadable files.
+        """
+        keys: List[Optional[Tuple]] = [(size,)] * len(paths)
+        for hash_func in (self.calculate_head_hash, self.calculate_content_hash):
+            # Queued buckets still run at interpreter exit, so they must be no-ops once cancelled
+            if self.is_cancelled():
+                return [None] * len(paths)
+            counts = Counter(key for key in keys if key is not None)
+            for i, key in enumerate(keys):
+                if key is None or counts[key] < 2:
+                    continue
+                try:
+                    keys[i] = key + (hash_func(paths[i]),)
+                except IOError:
+                    keys[i] = None  # Continue if hash calculation fails
+            if size <= DEDUPE_HEAD_BYTES:
+                break  # The head hash already covers the whole file
+        return keys
+
+    def _iter_dedupe_keys(self, reference_paths: List[FilePath],
+                          paths: List[FilePath]) -> Iterator[Tuple[Optional[Tuple], bool]]:
+        """Yield ``(key, matches_reference)`` for each of paths, in order.
+
+        Equal keys mean equal content. Files are only read when their size
+        collides with another file; each such size bucket is hashed as one job
+        on a thread pool, submitted in the order the buckets are needed, so the
+        caller can work through the results while later buckets are hashed.
+        ``matches_reference`` is True if the file is identical to one of
+        reference_paths. None keys mark unreadable files.
+        """
+        all_paths = list(reference_paths) + list(paths)
+        sizes: List[Optional[int]] = []
+        buckets: Dict[int, List[int]] = defaultdict(list)
+        for i, path in enumerate(all_paths):
+            try:
+                size = os.stat(path).st_size
+            except OSError:
+                size = None
+            sizes.append(size)
+            if size is not None:
+                buckets[size].append(i)
+
+        n_refs = len(reference_paths)
+        # A bucket of reference files only can't match any leftover, so it is never read
+        colliding = [
+            size for size, members in buckets.items()
+            if len(members) > 1 and any(i >= n_refs for i in members)
+        ]
+        if colliding:
+            self.logger.info(f"Comparing content of {sum(len(buckets[s]) for s in colliding)} "
+                             f"files with matching sizes")
+
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            # Buckets holding earlier leftovers come first, in the order they are needed
+            order = sorted(colliding, key=lambda size: next(
+                (i for i in buckets[size] if i >= n_refs), len(all_paths)
+            ))
+            futures = {
+                size: pool.submit(self._bucket_keys, [all_paths[i] for i in buckets[size]], size)
+                for size in order
+            }
+            # size -> ({path index: key}, keys of the reference files)
+            resolved: Dict[int, Tuple[Dict[int, Optional[Tuple]], Set[Tuple]]] = {}
+            try:
+                for i in range(n_refs, len(all_paths)):
+                    size = sizes[i]
+                    if size is None:
+                        yield None, False
+                    elif size not in futures:
+                        yield (size,), False
+                    else:
+                        if size not in resolved:
+                            members = buckets[size]
+                            keys = dict(zip(members, futures[size].result()))
+                            ref_keys = {keys[m] for m in members if m < n_refs} - {None}
+                            resolved[size] = (keys, ref_keys)
+                        keys, ref_keys = resolved[size]
+                        yield keys[i], keys[i] in ref_keys
+            finally:
+                for future in futures.values():
+                    future.cancel()
+
+    def is_cancelled(self) -> bool:
+        """Return True once the caller has set the cancel event."""
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def _stopped(self) -> bool:
+        """Return True (and say so in the log) if processing has been cancelled."""
+        if not self.is_cancelled():
+            return False
+        self.logger.warning("Processing cancelled before all files were staged")
+        return True
+
+    def _advance_progress(self, files_done: int) -> None:
+        """Count staged media files and notify the progress callback, if any."""
+        self._progress_done += files_done
+        if self.progress_callback is not None and self._progress_total:
+            self.progress_callback(min(self._progress_done, self._progress_total), self._progress_total)
+
+    def _walk_files(self, top: FilePath) -> Iterator[Tuple[str, List[str]]]:
+        """Yield ``(directory, file_names)`` under top, in os.walk's top-down order.
+
+        A single scandir pass per directory, without building the subdirectory
+        lists os.walk returns. Like os.walk, symlinked directories are not
+        followed. Stops early once processing is cancelled.
+        """
+        stack = [os.fspath(top)]
+        while stack:
+            if self.is_cancelled():
+                return
+            directory = stack.pop()
+            files = []
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            files.append(entry.name)
+                        elif not entry.is_symlink():
+                            subdirs.append(entry.path)
+            except OSError:
+                continue
+            yield directory, files
+            stack.extend(reversed(subdirs))
+
     def scan_media_files(self) -> Tuple[Dict, Dict, Dict]:
         """Scan root directory and index all media files."""
         by_dir_base = defaultdict(lambda: {"stills": [], "videos": []})
@@ -372,17 +759,25 @@ class GoogleTakeoutProcessor:
         videos_by_base = defaultdict(list)
 
         self.logger.info(f"Scanning directory: {self.root_dir}")
+        media_paths = []
+        dir_mtimes = {}
         
-        for root, _, files in os.walk(self.root_dir):
+        for root, files in self._walk_files(self.root_dir):
+            try:
+                dir_mtimes[root] = os.stat(root).st_mtime_ns
+            except OSError:
+                pass
+
             for filename in files:
                 self.stats['total_scanned'] += 1
                 
-                ext = Path(filename).suffix.lower()
+                base_name, ext = os.path.splitext(filename)
+                ext = ext.lower()
                 if ext not in ALL_EXTENSIONS:
                     continue
                     
-                base_name = Path(filename).stem
                 full_path = os.path.join(root, filename)
+                media_paths.append(full_path)
                 key = (root, base_name)
                 
                 if ext in STILL_EXTENSIONS:
@@ -393,6 +788,12 @@ class GoogleTakeoutProcessor:
                     videos_by_base[base_name].append(full_path)
 
         self.logger.info(f"Scanned {self.stats['total_scanned']} files")
+
+        # Every media file is staged exactly once, either in a pair or as a leftover
+        self._progress_done = 0
+        self._progress_total = len(media_paths)
+        self._scanned_dir_mtimes = dir_mtimes
+        self._scanned_media_paths = media_paths
         
         # Run validation and issue detection
         self.detect_duplicate_names(stills_by_base, videos_by_base)
@@ -419,116 +820,160 @@ class GoogleTakeoutProcessor:
         # Pass B: Cross-folder exact 1:1 matching with optional duration check
         all_base_names = set(stills_by_base.keys()) | set(videos_by_base.keys())
         
+        candidates = []
         for base_name in sorted(all_base_names):
+            if self.is_cancelled():
+                break
             unused_stills = [p for p in stills_by_base.get(base_name, []) if p not in used_files]
             unused_videos = [p for p in videos_by_base.get(base_name, []) if p not in used_files]
             
             if len(unused_stills) == 1 and len(unused_videos) == 1:
-                still_path, video_path = unused_stills[0], unused_videos[0]
-                
-                # Check video duration if specified
-                if self.max_video_duration and self.max_video_duration > 0:
-                    duration = self.get_video_duration(video_path)
-                    if duration is None or duration > self.max_video_duration:
-                        continue
-                
-                pairs.append(("cross_dir", base_name, still_path, video_path))
-                used_files.update([still_path, video_path])
-                self.stats['cross_dir_pairs'] += 1
+                candidates.append((base_name, unused_stills[0], unused_videos[0]))
+
+        # Check video durations if specified, probing all candidates in one batch
+        check_duration = bool(self.max_video_duration and self.max_video_duration > 0)
+        if check_duration:
+            durations = self._video_durations([video_path for _, _, video_path in candidates])
+
+        for base_name, still_path, video_path in candidates:
+            if check_duration:
+                duration = durations.get(video_path)
+                if duration is None or duration > self.max_video_duration:
+                    continue
+            
+            pairs.append(("cross_dir", base_name, still_path, video_path))
+            used_files.update([still_path, video_path])
+            self.stats['cross_dir_pairs'] += 1
 
         self.logger.info(f"Found {len(pairs)} pairs ({self.stats['same_dir_pairs']} same-dir, {self.stats['cross_dir_pairs']} cross-dir)")
         return pairs, used_files
 
-    def process_pairs(self, pairs: List[PairInfo]) -> Set[str]:
-        """Process and stage matched pairs."""
+    def _open_manifest(self, manifest_path: Path) -> ContextManager[Optional[TextIO]]:
+        """Open a manifest for writing, or stand in with None during a dry run."""
+        if self.dry_run:
+            return nullcontext()
+        return open(manifest_path, "w")
+
+    def process_pairs(self, pairs: List[PairInfo]) -> List[Path]:
+        """Process and stage matched pairs.
+
+        Returns the staged pair files that leftovers are deduplicated against
+        (empty unless ``dedupe_leftovers`` is set and this isn't a dry run).
+        """
         if not self.dry_run:
-            self.pairs_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.pairs_dir)
+            self._check_symlink_support(self.pairs_dir)
             
         pairs_manifest = self.pairs_dir / "manifest_pairs.tsv"
-        pair_hashes = set()
+        pair_outputs = []
         
-        if not self.dry_run:
-            with open(pairs_manifest, "w") as f:
-                f.write("pair_id\tmatch_type\tbasename\tstill_src\tvideo_src\tstill_out\tvideo_out\n")
+        # One handle for the whole run instead of reopening the manifest for every row
+        with self._open_manifest(pairs_manifest) as manifest:
+            if manifest is not None:
+                manifest.write("pair_id\tmatch_type\tbasename\tstill_src\tvideo_src\tstill_out\tvideo_out\n")
 
-        for i, (match_type, base_name, still_path, video_path) in enumerate(pairs, 1):
-            prefix = f"{i:05d}_{base_name}"
-            still_ext = Path(still_path).suffix
-            video_ext = Path(video_path).suffix
+            for i, (match_type, base_name, still_path, video_path) in enumerate(pairs, 1):
+                if self.is_cancelled():
+                    break
+
+                prefix = f"{i:05d}_{base_name}"
+                still_ext = Path(still_path).suffix
+                video_ext = Path(video_path).suffix
             
-            out_still = self.pairs_dir / f"{prefix}__STILL{still_ext}"
-            out_video = self.pairs_dir / f"{prefix}__VIDEO{video_ext}"
+                out_still = self.pairs_dir / f"{prefix}__STILL{still_ext}"
+                out_video = self.pairs_dir / f"{prefix}__VIDEO{video_ext}"
             
-            if self.verbose:
-                self.logger.info(f"[pair:{match_type}] {still_path} + {video_path} -> {out_still}, {out_video}")
+                if self.verbose:
+                    self.logger.info(f"[pair:{match_type}] {still_path} + {video_path} -> {out_still}, {out_video}")
             
-            if not self.dry_run:
-                self.safe_link_or_copy(still_path, out_still)
-                self.safe_link_or_copy(video_path, out_video)
+                if not self.dry_run:
+                    self.safe_link_or_copy(still_path, out_still)
+                    self.safe_link_or_copy(video_path, out_video)
                 
-                # Log to manifest
-                with open(pairs_manifest, "a") as f:
-                    f.write(f"{prefix}\t{match_type}\t{base_name}\t{still_path}\t{video_path}\t{out_still}\t{out_video}\n")
+                    # Log to manifest
+                    manifest.write(f"{prefix}\t{match_type}\t{base_name}\t{still_path}\t{video_path}\t{out_still}\t{out_video}\n")
                 
-                # Record hashes for deduplication
-                if self.dedupe_leftovers:
-                    try:
-                        pair_hashes.add(self.calculate_sha1(out_still))
-                        pair_hashes.add(self.calculate_sha1(out_video))
-                    except IOError:
-                        pass  # Continue if hash calculation fails
+                    # Compared with the leftovers for deduplication
+                    if self.dedupe_leftovers:
+                        pair_outputs.extend((out_still, out_video))
 
-        return pair_hashes
+                self._advance_progress(2)
 
-    def process_leftovers(self, used_files: Set[str], pair_hashes: Set[str]) -> None:
-        """Process and stage leftover files."""
+        return pair_outputs
+
+    def process_leftovers(self, used_files: Set[str], pair_outputs: List[Path],
+                          media_paths: Optional[List[str]] = None) -> None:
+        """Process and stage leftover files.
+
+        With ``dedupe_leftovers``, files identical to one of ``pair_outputs`` or
+        to an earlier leftover are skipped. ``media_paths`` is the media file
+        list of the scan; without it the root directory is walked again.
+        """
         if not self.dry_run:
-            self.leftovers_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.leftovers_dir)
+            self._check_symlink_support(self.leftovers_dir)
             
         leftovers_manifest = self.leftovers_dir / "manifest_leftovers.tsv"
-        leftovers_hashes = set()
+        leftovers_keys = set()
         leftover_id = 0
         
-        if not self.dry_run:
-            with open(leftovers_manifest, "w") as f:
-                f.write("left_id\taction\tsrc\tout_or_reason\n")
+        with self._open_manifest(leftovers_manifest) as manifest:
+            if manifest is not None:
+                manifest.write("left_id\taction\tsrc\tout_or_reason\n")
+
+            candidates = []
+            if media_paths is not None:
+                for src_path in media_paths:
+                    if src_path not in used_files:
+                        candidates.append((src_path, os.path.basename(src_path)))
+            else:
+                for root, files in self._walk_files(self.root_dir):
+                    for filename in files:
+                        ext = os.path.splitext(filename)[1].lower()
+                        if ext not in ALL_EXTENSIONS:
+                            continue
+                        
+                        src_path = os.path.join(root, filename)
+                        if src_path in used_files:
+                            continue  # Skip files that are part of pairs
+                        candidates.append((src_path, filename))
+
+            if self.is_cancelled():
+                return
+
+            # Colliding sizes are hashed ahead on the pool while files are staged in order
+            if self.dedupe_leftovers and not self.dry_run:
+                dedupe_keys = self._iter_dedupe_keys(
+                    pair_outputs, [src_path for src_path, _ in candidates]
+                )
+            else:
+                dedupe_keys = repeat((None, False))
+
+            for (src_path, filename), (file_key, in_pairs) in zip(candidates, dedupe_keys):
+                if self.is_cancelled():
+                    return
 
-        for root, _, files in os.walk(self.root_dir):
-            for filename in files:
-                ext = Path(filename).suffix.lower()
-                if ext not in ALL_EXTENSIONS:
-                    continue
-                    
-                src_path = os.path.join(root, filename)
-                if src_path in used_files:
-                    continue  # Skip files that are part of pairs
-                
                 leftover_id += 1
+                self._advance_progress(1)
                 out_path = self.leftovers_dir / f"L{leftover_id:06d}__{filename}"
-                
+            
                 # Handle deduplication
-                if self.dedupe_leftovers and not self.dry_run:
-                    try:
-                        file_hash = self.calculate_sha1(src_path)
-                        if file_hash in pair_hashes or file_hash in leftovers_hashes:
-                            self.stats['leftovers_skipped'] += 1
-                            if self.verbose:
-                                self.logger.info(f"[skip-dup] {src_path}")
-                            with open(leftovers_manifest, "a") as f:
-                                f.write(f"L{leftover_id:06d}\tSKIP_DUP\t{src_path}\tduplicate-of-pairs-or-leftovers\n")
-                            continue
-                        leftovers_hashes.add(file_hash)
-                    except IOError:
-                        pass  # Continue if hash calculation fails
-                
+                if file_key is not None:
+                    if in_pairs or file_key in leftovers_keys:
+                        self.stats['leftovers_skipped'] += 1
+                        if self.verbose:
+                            self.logger.info(f"[skip-dup] {src_path}")
+                        manifest.write(f"L{leftover_id:06d}\tSKIP_DUP\t{src_path}\tduplicate-of-pairs-or-leftovers\n")
+                        continue
+                    leftovers_keys.add(file_key)
+            
                 if self.verbose:
                     self.logger.info(f"[leftover] {src_path} -> {out_path}")
-                
+            
                 if not self.dry_run:
                     self.safe_link_or_copy(src_path, out_path)
-                    with open(leftovers_manifest, "a") as f:
-                        f.write(f"L{leftover_id:06d}\tCOPIED\t{src_path}\t{out_path}\n")
-                
+                    manifest.write(f"L{leftover_id:06d}\tCOPIED\t{src_path}\t{out_path}\n")
+            
                 self.stats['leftovers_staged'] += 1
 
     def process(self) -> None:
@@ -536,27 +981,44 @@ class GoogleTakeoutProcessor:
         if not self.root_dir.is_dir():
             raise FileNotFoundError(f"Root directory does not exist: {self.root_dir}")
         
-        # Validate Google Takeout structure
-        structure_valid = self.validate_takeout_structure()
+        # Reuse the previous scan when the tree is unchanged (e.g. dry run, then real run)
+        cached = self._cached_scan()
+        if cached is not None:
+            structure_valid, by_dir_base, stills_by_base, videos_by_base = cached
+        else:
+            # Validate Google Takeout structure
+            structure_valid = self.validate_takeout_structure()
+
         if not structure_valid and not self.dry_run:
             self.logger.warning("⚠️  Directory structure validation failed!")
             self.logger.warning("This may not be a proper Google Takeout directory.")
             self.logger.warning("Expected structure: Takeout/Google Photos/Photos from YYYY/...")
         
-        # Scan and index files
-        by_dir_base, stills_by_base, videos_by_base = self.scan_media_files()
+        if cached is None:
+            # Scan and index files
+            by_dir_base, stills_by_base, videos_by_base = self.scan_media_files()
+            # A partial index from a cancelled scan must not be reused
+            if self._stopped():
+                return
+            self._cache_scan(structure_valid, by_dir_base, stills_by_base, videos_by_base)
         
         # Find pairs
         pairs, used_files = self.find_pairs(by_dir_base, stills_by_base, videos_by_base)
         
         # Check for orphaned videos after pairing
         self.detect_orphaned_videos(videos_by_base, used_files)
+        if self._stopped():
+            return
         
         # Process pairs
-        pair_hashes = self.process_pairs(pairs)
+        pair_outputs = self.process_pairs(pairs)
         
         # Process leftovers
-        self.process_leftovers(used_files, pair_hashes)
+        if not self.is_cancelled():
+            self.process_leftovers(used_files, pair_outputs, self._scanned_media_paths)
+
+        if self._stopped():
+            return
         
         # Print summary
         self.print_summary()
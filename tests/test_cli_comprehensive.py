@@ -34,7 +34,7 @@ class TestCLIArgumentParsing(unittest.TestCase):
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     @patch('sys.argv')
-    @patch('google_takeout_live_photos.cli.GoogleTakeoutProcessor')
+    @patch('google_takeout_live_photos.processor.GoogleTakeoutProcessor')
     def test_cli_single_output_mode(self, mock_processor_class, mock_argv):
         """Test CLI with single output directory mode."""
         mock_argv.__getitem__.side_effect = lambda x: [
@@ -107,7 +107,7 @@ class TestCLIArgumentParsing(unittest.TestCase):
                 mock_error.assert_called()
 
     @patch('sys.argv')
-    @patch('google_takeout_live_photos.cli.GoogleTakeoutProcessor')
+    @patch('google_takeout_live_photos.processor.GoogleTakeoutProcessor')
     def test_cli_keyboard_interrupt(self, mock_processor_class, mock_argv):
         """Test CLI handling of keyboard interrupt."""
         mock_argv.__getitem__.side_effect = lambda x: [
@@ -141,7 +141,7 @@ class TestCLIArgumentParsing(unittest.TestCase):
                     mock_exit.assert_called_with(1)
 
     @patch('sys.argv')
-    @patch('google_takeout_live_photos.cli.GoogleTakeoutProcessor')
+    @patch('google_takeout_live_photos.processor.GoogleTakeoutProcessor')
     def test_cli_processing_exception(self, mock_processor_class, mock_argv):
         """Test CLI handling of processing exceptions."""
         mock_processor = Mock()
@@ -3,8 +3,10 @@ Unit tests for the GUI interface.
 """
 
 import os
+import queue
 import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -156,6 +158,186 @@ class TestGUIIntegration(unittest.TestCase):
             self.assertTrue(app.validate_inputs())
 
 
+class TestGUIHeadless(unittest.TestCase):
+    """Test GUI logic on an instance built without a Tk root window."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        from google_takeout_live_photos import gui
+        self.gui = gui
+
+        # Only the attributes the methods under test read; no widgets are created
+        app = gui.GoogleTakeoutGUI.__new__(gui.GoogleTakeoutGUI)
+        app.root = Mock()
+        app.processor = None
+        app.processing = False
+        app.log_text = Mock()
+        app.progress = Mock()
+        app.status_label = Mock()
+        app._status_colors = {"INFO": "black"}
+        app._ui_queue = queue.Queue()
+        app._cancel = threading.Event()
+        app._isdir_cache = {}
+        app._validated_paths = None
+        app._last_progress_pct = -1
+        app._last_pulse = 0.0
+        app._log_lines = 0
+        app._pairs_dir = self.temp_dir / 'out' / 'pairs'
+        app._leftovers_dir = self.temp_dir / 'out' / 'leftovers'
+        self.app = app
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _set_dirs(self, root_text, output_text):
+        """Point the folder fields at the given paths."""
+        self.app.root_dir = Mock(get=Mock(return_value=str(root_text)))
+        self.app.output_dir = Mock(get=Mock(return_value=str(output_text)))
+
+    def _config(self, root_path):
+        """Build the options snapshot start_processing hands to the worker."""
+        return {
+            'root_dir': root_path,
+            'copy_files': True,
+            'dry_run': False,
+            'verbose': False,
+            'max_video_duration': 6.0,
+            'dedupe_leftovers': False,
+            'prepare_apple': False,
+            'show_issues': False,
+        }
+
+    def test_drain_applies_at_most_one_batch(self):
+        """A backlog is drained in UI_BATCH_SIZE slices with a prompt follow-up."""
+        for i in range(self.gui.UI_BATCH_SIZE + 10):
+            self.app.log_message(f"line {i}")
+
+        self.app._drain_ui_queue()
+
+        # One insert for the whole batch: text and level tag per message
+        self.app.log_text.insert.assert_called_once()
+        args = self.app.log_text.insert.call_args[0]
+        self.assertEqual(len(args), 1 + 2 * self.gui.UI_BATCH_SIZE)
+        self.assertEqual(self.app._ui_queue.qsize(), 10)
+        self.app.root.after.assert_called_once_with(1, self.app._drain_ui_queue)
+
+        self.app._drain_ui_queue()
+
+        self.assertTrue(self.app._ui_queue.empty())
+        self.app.root.after.assert_called_with(
+            self.gui.UI_POLL_INTERVAL_MS, self.app._drain_ui_queue
+        )
+
+    def test_drain_trims_oldest_log_lines(self):
+        """Lines beyond MAX_LOG_LINES are removed from the top in one delete."""
+        with patch('google_takeout_live_photos.gui.MAX_LOG_LINES', 10):
+            for i in range(15):
+                self.app.log_message(f"line {i}")
+            self.app._drain_ui_queue()
+
+        self.app.log_text.delete.assert_called_once_with("1.0", "6.0")
+        self.assertEqual(self.app._log_lines, 10)
+
+    def test_drain_skips_info_logs_after_cancel(self):
+        """Queued progress chatter is dropped once Stop was pressed, warnings are kept."""
+        self.app.log_message("still scanning")
+        self.app.log_message("Processing stopped by user", "WARNING")
+        self.app._cancel.set()
+
+        self.app._drain_ui_queue()
+
+        args = self.app.log_text.insert.call_args[0]
+        self.assertEqual(args[1:], ("[WARNING] Processing stopped by user\n", "WARNING"))
+
+    def test_validate_inputs_reuses_validated_paths(self):
+        """Unchanged folders are not re-read or re-resolved on the next run."""
+        self._set_dirs(self.temp_dir / 'takeout', self.temp_dir / 'out')
+        (self.temp_dir / 'takeout').mkdir()
+
+        self.assertTrue(self.app.validate_inputs())
+        self.assertEqual(
+            self.app._validated_paths,
+            ((self.temp_dir / 'takeout').resolve(), (self.temp_dir / 'out').resolve()),
+        )
+        self.assertTrue(self.app.validate_inputs())
+        self.assertEqual(self.app.root_dir.get.call_count, 1)
+
+        # Editing either folder field drops the cached result
+        self.app._invalidate_validation('PY_VAR0', '', 'write')
+        self.assertIsNone(self.app._validated_paths)
+        self.assertTrue(self.app.validate_inputs())
+        self.assertEqual(self.app.root_dir.get.call_count, 2)
+
+    def test_validate_inputs_rechecks_removed_folder(self):
+        """A cached result is dropped once the Takeout folder no longer exists."""
+        self._set_dirs(self.temp_dir / 'takeout', self.temp_dir / 'out')
+        self.app._validated_paths = (self.temp_dir / 'missing', self.temp_dir / 'out')
+
+        with patch('google_takeout_live_photos.gui.messagebox') as mock_box:
+            self.assertFalse(self.app.validate_inputs())
+
+        self.assertIsNone(self.app._validated_paths)
+        mock_box.showerror.assert_called_once_with(
+            "Error", "Google Takeout directory does not exist"
+        )
+
+    def test_validate_inputs_rejects_output_inside_input(self):
+        """The output folder may not be the Takeout folder or live below it."""
+        takeout = self.temp_dir / 'takeout'
+        takeout.mkdir()
+
+        for output_text in (takeout, takeout / 'sorted', takeout / 'sorted' / '..'):
+            self._set_dirs(takeout, output_text)
+            with patch('google_takeout_live_photos.gui.messagebox') as mock_box:
+                self.assertFalse(self.app.validate_inputs())
+            mock_box.showerror.assert_called_once()
+            self.assertIsNone(self.app._validated_paths)
+
+        # A sibling whose name merely starts with the Takeout folder's name is fine
+        self._set_dirs(takeout, self.temp_dir / 'takeout-sorted')
+        self.assertTrue(self.app.validate_inputs())
+
+    @patch('google_takeout_live_photos.gui.GoogleTakeoutProcessor')
+    def test_process_photos_reapplies_for_same_root(self, mock_processor_class):
+        """A repeat run on the same Takeout folder reuses the scanned processor."""
+        root_path = self.temp_dir / 'takeout'
+        previous = Mock(root_dir=root_path)
+        self.app.processor = previous
+
+        self.app.process_photos(self._config(root_path))
+
+        mock_processor_class.assert_not_called()
+        previous.reapply.assert_called_once()
+        self.assertTrue(previous.reapply.call_args[1]['copy_files'])
+        self.assertIs(previous.reapply.call_args[1]['cancel_event'], self.app._cancel)
+        previous.process.assert_called_once()
+        self.assertIs(self.app.processor, previous)
+
+    @patch('google_takeout_live_photos.gui.GoogleTakeoutProcessor')
+    def test_process_photos_rescans_for_new_root(self, mock_processor_class):
+        """A different Takeout folder gets a fresh processor."""
+        previous = Mock(root_dir=self.temp_dir / 'old')
+        self.app.processor = previous
+        root_path = self.temp_dir / 'takeout'
+
+        self.app.process_photos(self._config(root_path))
+
+        previous.reapply.assert_not_called()
+        mock_processor_class.assert_called_once()
+        self.assertEqual(mock_processor_class.call_args[1]['root_dir'], root_path)
+        self.assertIs(self.app.processor, mock_processor_class.return_value)
+        self.app.processor.process.assert_called_once()
+
+        # The run reports back through the queue; nothing touched Tk from the worker
+        items = []
+        while not self.app._ui_queue.empty():
+            items.append(self.app._ui_queue.get_nowait())
+        self.assertEqual(items[-1], ("done", None, (True, None, False)))
+
+
 class TestMainEntryPoints(unittest.TestCase):
     """Test main entry points for GUI."""
 
@@ -218,12 +218,28 @@ class TestProcessorFileOperations(unittest.TestCase):
         
         pairs = [("same_dir", "IMG_001", str(still_file), str(video_file))]
         
-        pair_hashes = self.processor.process_pairs(pairs)
+        pair_outputs = self.processor.process_pairs(pairs)
         
         # Check that files were processed
         self.assertTrue(self.pairs_dir.exists())
         pair_files = list(self.pairs_dir.glob("*"))
         self.assertGreaterEqual(len(pair_files), 2)  # At least 2 files + manifest
+        self.assertEqual(pair_outputs, [])  # Nothing to dedupe against without dedupe_leftovers
+
+    def test_process_pairs_returns_staged_files_for_dedupe(self):
+        """Test that with deduplication the staged pair files are returned for the leftovers."""
+        still_file = self.root_dir / "IMG_001.jpg"
+        video_file = self.root_dir / "IMG_001.mov"
+        still_file.write_bytes(b"fake image data")
+        video_file.write_bytes(b"fake video data")
+        self.processor.dedupe_leftovers = True
+
+        pairs = [("same_dir", "IMG_001", str(still_file), str(video_file))]
+        pair_outputs = self.processor.process_pairs(pairs)
+
+        self.assertEqual([p.name for p in pair_outputs],
+                         ["00001_IMG_001__STILL.jpg", "00001_IMG_001__VIDEO.mov"])
+        self.assertEqual(pair_outputs[0].read_bytes(), b"fake image data")
 
     def test_process_leftovers_with_deduplication(self):
         """Test leftover processing with deduplication."""
@@ -232,18 +248,31 @@ class TestProcessorFileOperations(unittest.TestCase):
         leftover_file.write_bytes(b"unique content")
         
         used_files = set()  # No used files
-        pair_hashes = set()  # No pair hashes
+        pair_outputs = []  # No staged pair files
         
         # Enable deduplication
         self.processor.dedupe_leftovers = True
         
-        self.processor.process_leftovers(used_files, pair_hashes)
+        self.processor.process_leftovers(used_files, pair_outputs)
         
         # Check that leftovers were processed
         self.assertTrue(self.leftovers_dir.exists())
         leftover_files = list(self.leftovers_dir.glob("L*"))
         self.assertGreaterEqual(len(leftover_files), 1)
 
+    def test_process_leftovers_uses_scanned_paths(self):
+        """Test leftovers come from the scan's file list without walking the tree again."""
+        paired = self.root_dir / "IMG_PAIRED.jpg"
+        leftover = self.root_dir / "IMG_LEFTOVER.jpg"
+        paired.write_bytes(b"paired")
+        leftover.write_bytes(b"leftover")
+
+        with patch.object(self.processor, '_walk_files', side_effect=AssertionError("walked")):
+            self.processor.process_leftovers({str(paired)}, set(), [str(paired), str(leftover)])
+
+        leftover_files = sorted(p.name for p in self.leftovers_dir.glob("L*"))
+        self.assertEqual(leftover_files, ["L000001__IMG_LEFTOVER.jpg"])
+
     def test_safe_link_or_copy_symlink_mode(self):
         """Test symlink creation mode."""
         processor = GoogleTakeoutProcessor(
@@ -263,6 +292,64 @@ class TestProcessorFileOperations(unittest.TestCase):
         # On systems that support symlinks, this should be a symlink
         # On Windows, it might fall back to copy
 
+    def test_unsupported_symlinks_fall_back_to_copy(self):
+        """Test that symlink support is probed once and copying is used when it fails."""
+        (self.root_dir / "IMG_001.jpg").write_bytes(b"still")
+        (self.root_dir / "IMG_001.mov").write_bytes(b"video")
+
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            copy_files=False
+        )
+        pairs = [("same_dir", "IMG_001", str(self.root_dir / "IMG_001.jpg"), str(self.root_dir / "IMG_001.mov"))]
+
+        with patch('os.symlink', side_effect=OSError("not permitted")) as mock_symlink:
+            processor.process_pairs(pairs)
+
+        mock_symlink.assert_called_once()  # Only the probe
+        staged = list(self.pairs_dir.glob("*__STILL*"))
+        self.assertEqual(len(staged), 1)
+        self.assertFalse(staged[0].is_symlink())
+        self.assertEqual(staged[0].read_bytes(), b"still")
+
+    def test_symlink_probe_stays_inside_output_dir(self):
+        """Test that the symlink probe targets a temp file in the output dir and is removed."""
+        self.pairs_dir.mkdir(parents=True)
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            copy_files=False
+        )
+
+        with patch('os.symlink', wraps=os.symlink) as mock_symlink:
+            processor._check_symlink_support(processor.pairs_dir)
+
+        target = Path(mock_symlink.call_args.args[0])
+        self.assertEqual(target.parent, processor.pairs_dir)
+        self.assertEqual(list(self.pairs_dir.iterdir()), [])
+        self.assertNotIn(processor.pairs_dir, processor._copy_only_dirs)
+
+    def test_output_dir_created_once_per_run(self):
+        """Test that staging several files into one folder only creates it once."""
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            copy_files=True
+        )
+        for name in ("a.jpg", "b.jpg"):
+            (self.root_dir / name).write_bytes(b"data")
+
+        with patch.object(Path, 'mkdir', autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            processor.safe_link_or_copy(self.root_dir / "a.jpg", self.pairs_dir / "a.jpg")
+            processor.safe_link_or_copy(self.root_dir / "b.jpg", self.pairs_dir / "b.jpg")
+
+        mock_mkdir.assert_called_once()
+        self.assertTrue((self.pairs_dir / "b.jpg").exists())
+
     def test_safe_link_or_copy_existing_file(self):
         """Test behavior when destination already exists."""
         src = self.root_dir / "source.txt"
@@ -389,6 +476,124 @@ class TestProcessorEdgeCases(unittest.TestCase):
         self.assertEqual(len(hash_result), 40)  # SHA1 is 40 hex characters
         self.assertTrue(all(c in '0123456789abcdef' for c in hash_result))
 
+    def test_calculate_sha1_chunked_fallback_matches(self):
+        """Test the pre-3.11 chunked loop gives the same hash as file_digest."""
+        test_file = self.root_dir / "fallback_test.jpg"
+        test_file.write_bytes(b"B" * (3 * 1024 * 1024 + 7))
+
+        expected = GoogleTakeoutProcessor.calculate_sha1(test_file)
+        with patch('google_takeout_live_photos.processor._HAS_FILE_DIGEST', False):
+            self.assertEqual(GoogleTakeoutProcessor.calculate_sha1(test_file), expected)
+
+    def test_calculate_sha1_memory_mapped_file(self):
+        """Test files above the mmap threshold hash to the plain SHA1 of their bytes."""
+        import hashlib
+        test_file = self.root_dir / "mapped_test.mov"
+        content = os.urandom(1024) * (5 * 1024)  # 5MB
+        test_file.write_bytes(content)
+
+        self.assertEqual(
+            GoogleTakeoutProcessor.calculate_sha1(test_file), hashlib.sha1(content).hexdigest()
+        )
+
+    def test_content_hash_falls_back_to_sha1(self):
+        """Test dedupe hashing uses SHA1 when blake3 isn't installed."""
+        test_file = self.root_dir / "content_hash.jpg"
+        test_file.write_bytes(b"content")
+
+        with patch('google_takeout_live_photos.processor.blake3', None):
+            self.assertEqual(
+                GoogleTakeoutProcessor.calculate_content_hash(test_file),
+                GoogleTakeoutProcessor.calculate_sha1(test_file),
+            )
+
+    def test_walk_files_matches_os_walk(self):
+        """Test the scandir walker visits the same files in the same order as os.walk."""
+        (self.root_dir / "a" / "b").mkdir(parents=True)
+        (self.root_dir / "c").mkdir()
+        for name in ("top.jpg", "a/one.mov", "a/b/two.heic", "c/three.png"):
+            (self.root_dir / name).touch()
+
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+        )
+        expected = [(root, sorted(files)) for root, _, files in os.walk(processor.root_dir)]
+        walked = [(root, sorted(files)) for root, files in processor._walk_files(processor.root_dir)]
+        self.assertEqual(walked, expected)
+
+    def test_dedupe_keys_only_hash_colliding_files(self):
+        """Test dedupe keys separate contents while hashing only same-size files."""
+        block = b"A" * (128 * 1024)
+        original = self.root_dir / "original.jpg"
+        copy = self.root_dir / "copy.jpg"
+        same_head = self.root_dir / "same_head.jpg"
+        other_size = self.root_dir / "other_size.jpg"
+        original.write_bytes(block)
+        copy.write_bytes(block)
+        same_head.write_bytes(block[:-1] + b"B")
+        other_size.write_bytes(b"small")
+        missing = self.root_dir / "missing.jpg"
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+        )
+
+        with patch.object(GoogleTakeoutProcessor, 'calculate_content_hash',
+                          side_effect=GoogleTakeoutProcessor.calculate_sha1) as mock_hash:
+            results = list(processor._iter_dedupe_keys(
+                [original], [copy, same_head, other_size, missing]
+            ))
+
+        (copy_key, copy_match), (head_key, head_match), other, unreadable = results
+        self.assertTrue(copy_match)
+        self.assertFalse(head_match)
+        self.assertNotEqual(copy_key, head_key)
+        self.assertEqual(other, ((5,), False))
+        self.assertEqual(unreadable, (None, False))
+        hashed = sorted(Path(call.args[0]).name for call in mock_hash.call_args_list)
+        self.assertEqual(hashed, ["copy.jpg", "original.jpg", "same_head.jpg"])
+
+    def test_dedupe_keys_skip_reference_only_collisions(self):
+        """Test same-size pair outputs are not hashed when no leftover shares their size."""
+        first = self.root_dir / "first.jpg"
+        second = self.root_dir / "second.jpg"
+        leftover = self.root_dir / "leftover.jpg"
+        first.write_bytes(b"A" * 1024)
+        second.write_bytes(b"B" * 1024)
+        leftover.write_bytes(b"small")
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+        )
+
+        with patch.object(processor, '_bucket_keys') as mock_bucket, \
+             patch.object(GoogleTakeoutProcessor, 'calculate_head_hash') as mock_head, \
+             patch.object(processor.logger, 'info') as mock_info:
+            results = list(processor._iter_dedupe_keys([first, second], [leftover]))
+
+        self.assertEqual(results, [((5,), False)])
+        mock_bucket.assert_not_called()
+        mock_head.assert_not_called()
+        mock_info.assert_not_called()
+
+    def test_content_hash_blake3_threads(self):
+        """Test BLAKE3 hashes single-threaded unless asked to use all cores."""
+        test_file = self.root_dir / "blake3.jpg"
+        test_file.write_bytes(b"content")
+        fake_blake3 = Mock()
+        fake_blake3.blake3.AUTO = -1
+        fake_blake3.blake3.return_value.hexdigest.return_value = "digest"
+
+        with patch('google_takeout_live_photos.processor.blake3', fake_blake3):
+            self.assertEqual(GoogleTakeoutProcessor.calculate_content_hash(test_file), "digest")
+            fake_blake3.blake3.assert_called_with(max_threads=1)
+            GoogleTakeoutProcessor.calculate_content_hash(test_file, multithreaded=True)
+            fake_blake3.blake3.assert_called_with(max_threads=-1)
+
     def test_calculate_sha1_nonexistent_file(self):
         """Test SHA1 calculation with non-existent file."""
         nonexistent_file = self.root_dir / "nonexistent.jpg"
@@ -396,6 +601,28 @@ class TestProcessorEdgeCases(unittest.TestCase):
         with self.assertRaises(IOError):
             GoogleTakeoutProcessor.calculate_sha1(nonexistent_file)
 
+    @patch.object(GoogleTakeoutProcessor, 'get_video_duration', return_value=2.5)
+    def test_video_durations_cached_and_size_filtered(self, mock_duration):
+        """Test ffprobe runs once per file version and not at all for oversized videos."""
+        short_video = self.root_dir / "IMG_SHORT.MOV"
+        big_video = self.root_dir / "IMG_BIG.MOV"
+        short_video.write_bytes(b"\0" * 1024)
+        big_video.write_bytes(b"\0" * 1024)
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            max_video_duration=6.0,
+        )
+        paths = [str(short_video)]
+        self.assertEqual(processor._video_durations(paths), {str(short_video): 2.5})
+        self.assertEqual(processor._video_durations(paths), {str(short_video): 2.5})
+        self.assertEqual(mock_duration.call_count, 1)
+
+        processor.max_video_duration = 0.0001  # size limit of 400 bytes
+        self.assertEqual(processor._video_durations([str(big_video)]), {str(big_video): None})
+        self.assertEqual(mock_duration.call_count, 1)
+
     @patch('subprocess.run')
     def test_get_video_duration_timeout(self, mock_run):
         """Test video duration with timeout."""
@@ -432,6 +659,152 @@ class TestProcessorEdgeCases(unittest.TestCase):
         except Exception as e:
             self.fail(f"Processing in verbose mode failed: {e}")
 
+    def test_process_reports_progress(self):
+        """Test that staging progress is reported up to the media file total."""
+        (self.root_dir / "IMG_001.HEIC").touch()
+        (self.root_dir / "IMG_001.MOV").touch()
+        (self.root_dir / "IMG_002.JPG").touch()
+        (self.root_dir / "notes.txt").touch()  # Not counted as media
+
+        updates = []
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            dry_run=True,
+            progress_callback=lambda done, total: updates.append((done, total))
+        )
+        processor.process()
+
+        self.assertEqual(updates, [(2, 3), (3, 3)])
+
+    def test_process_stops_when_cancelled(self):
+        """Test that a set cancel event stops the scan before any files are indexed or written."""
+        import threading
+
+        (self.root_dir / "IMG_001.HEIC").touch()
+        (self.root_dir / "IMG_001.MOV").touch()
+        (self.root_dir / "IMG_002.JPG").touch()
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            copy_files=True,
+            cancel_event=cancel_event
+        )
+        processor.process()
+
+        self.assertEqual(processor.stats['total_scanned'], 0)
+        self.assertIsNone(processor._scan_cache)
+        self.assertEqual(processor.stats['leftovers_staged'], 0)
+        self.assertEqual(list(self.pairs_dir.glob("*__STILL*")), [])
+
+    @patch('subprocess.run')
+    def test_prepare_for_apple_stops_when_cancelled(self, mock_run):
+        """Test that Apple preparation runs no ExifTool once the run is cancelled."""
+        import threading
+
+        self.pairs_dir.mkdir(parents=True)
+        (self.pairs_dir / "manifest_pairs.tsv").write_text(
+            "pair_id\tmatch_type\tbasename\tstill_src\tvideo_src\tstill_out\tvideo_out\n"
+            "00001_IMG\tsame_dir\tIMG\ta.heic\ta.mov\tout.heic\tout.mov\n"
+        )
+        cancel_event = threading.Event()
+        cancel_event.set()
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            cancel_event=cancel_event
+        )
+
+        with patch.object(processor, '_resolve_exiftool_path', return_value=Path("exiftool")):
+            processor.prepare_for_apple()
+
+        mock_run.assert_not_called()
+
+    @patch.object(GoogleTakeoutProcessor, 'get_video_duration', return_value=2.0)
+    def test_pooled_work_skipped_when_cancelled(self, mock_duration):
+        """Test that queued ffprobe and hash jobs do nothing once the run is cancelled."""
+        import threading
+
+        video = self.root_dir / "IMG_001.MOV"
+        video.write_bytes(b"video")
+        same_size = self.root_dir / "IMG_002.MOV"
+        same_size.write_bytes(b"VIDEO")
+        cancel_event = threading.Event()
+        cancel_event.set()
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            cancel_event=cancel_event
+        )
+
+        self.assertEqual(processor._video_durations([str(video)]), {})
+        self.assertEqual(list(processor._iter_dedupe_keys([], [video, same_size])),
+                         [(None, False), (None, False)])
+        mock_duration.assert_not_called()
+        self.assertEqual(processor._duration_cache, {})
+
+    def test_reapply_reuses_unchanged_scan(self):
+        """Test that a second run after reapply() skips rescanning an unchanged tree."""
+        (self.root_dir / "IMG_001.HEIC").write_bytes(b"still")
+        (self.root_dir / "IMG_001.MOV").write_bytes(b"video")
+        (self.root_dir / "IMG_002.JPG").write_bytes(b"other")
+
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            dry_run=True
+        )
+        processor.process()
+
+        processor.reapply(dry_run=False, copy_files=True)
+        with patch.object(processor, 'scan_media_files', side_effect=AssertionError("rescanned")):
+            processor.process()
+
+        self.assertEqual(processor.stats['total_scanned'], 3)
+        self.assertEqual(processor.stats['same_dir_pairs'], 1)
+        self.assertEqual(processor.stats['leftovers_staged'], 1)
+        self.assertEqual(len(list(self.pairs_dir.glob("*__STILL*"))), 1)
+
+    def test_reapply_rescans_modified_tree(self):
+        """Test that a directory change since the last scan forces a rescan."""
+        subdir = self.root_dir / "Photos from 2023"
+        subdir.mkdir()
+        (subdir / "IMG_001.JPG").touch()
+
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir,
+            dry_run=True
+        )
+        processor.process()
+        self.assertEqual(processor.stats['total_scanned'], 1)
+
+        (subdir / "IMG_002.JPG").touch()
+        os.utime(subdir, ns=(0, 0))  # Guarantee a different mtime on coarse filesystems
+
+        processor.reapply(dry_run=True)
+        processor.process()
+        self.assertEqual(processor.stats['total_scanned'], 2)
+
+    def test_reapply_rejects_unknown_option(self):
+        """Test that reapply() only accepts per-run options."""
+        processor = GoogleTakeoutProcessor(
+            root_dir=self.root_dir,
+            pairs_dir=self.pairs_dir,
+            leftovers_dir=self.leftovers_dir
+        )
+        with self.assertRaises(TypeError):
+            processor.reapply(root_dir=self.temp_dir)
+
     def test_process_with_deduplication(self):
         """Test processing with deduplication enabled."""
         # Create duplicate content files